@@ -1 +0,0 @@
-from aworld.tools.mcp_tool.async_mcp_tool import McpTool  # must: register mcp tool
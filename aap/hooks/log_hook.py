@@ -1,10 +1,12 @@
-from aworld.core.agent.base import AgentFactory
 from aworld.core.context.base import Context
 from aworld.core.event.base import Message
 from aworld.runners.hook.hook_factory import HookFactory
 from aworld.runners.hook.hooks import PostLLMCallHook, PreLLMCallHook
 from aworld.utils.common import convert_to_snake
 
+_LOG_OBSERVATION_HOOK_NAME: str = convert_to_snake("LogObservationHook")
+_LOG_ACTION_LLM_HOOK_NAME: str = convert_to_snake("LogActionLLMHook")
+
 
 @HookFactory.register(
     name="LogObservationHook",
@@ -12,11 +14,10 @@ from aworld.utils.common import convert_to_snake
 )
 class LogObservationHook(PreLLMCallHook):
     def name(self) -> str:
-        return convert_to_snake("LogObservationHook")
+        return _LOG_OBSERVATION_HOOK_NAME
 
     async def exec(self, message: Message, context: Context = None) -> Message:
-        agent = AgentFactory.agent_instance(message.sender)
-        context = agent.context
+        context = context or message.context
         context.context_info.set("step", 1)
         return message
 
@@ -27,10 +28,9 @@ class LogObservationHook(PreLLMCallHook):
 )
 class LogActionLLMHook(PostLLMCallHook):
     def name(self) -> str:
-        return convert_to_snake("LogActionLLMHook")
+        return _LOG_ACTION_LLM_HOOK_NAME
 
     async def exec(self, message: Message, context: Context = None) -> Message:
-        agent = AgentFactory.agent_instance(message.sender)
-        context = agent.context
+        context = context or message.context
         assert context.context_info.get("step") == 1
         return message
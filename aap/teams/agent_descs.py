@@ -0,0 +1,26 @@
+from typing import Final
+
+# Descriptions the planner sees for each agent of the team.
+MAIN_AGENT_DESC: Final[str] = "main_agent"
+SEARCH_AGENT_DESC: Final[str] = (
+    "Provide Google search ability to fetch relevant documents based on the task."
+)
+BROWSER_AGENT_DESC: Final[str] = (
+    "Control a web browser to interact with web pages. "
+    "Could read web content with flexible information gathering."
+)
+DOCUMENT_AGENT_DESC: Final[str] = (
+    "Process document using Datalab SDK with advanced OCR capabilities. "
+    "Convert document to markdown foramt. "
+    "Support PDFs, DOCX, XLSX, PPTX, HTML, and images."
+)
+AUDIO_AGENT_DESC: Final[str] = "Answer audio file related questions."
+IMAGE_AGENT_DESC: Final[str] = "Answer image file related questions."
+VIDEO_AGENT_DESC: Final[str] = "Answer video file related questions."
+THINK_AGENT_DESC: Final[str] = (
+    "Process complex reasoning tasks with structured output. "
+    "Handles mathematical proofs, programming challenges, "
+    "and logical problems "
+    "while maintaining processing context and metadata."
+)
+CODE_AGENT_DESC: Final[str] = "Write code to solve problems."
@@ -4,20 +4,41 @@ Modern Python 3.11+ implementation with type hints and Pydantic models
 """
 
 import asyncio
-import json
+import functools
+import heapq
+import itertools
 import logging
+import os
+import random
+import time
 import uuid
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
 
-from aworld.agents.llm_agent import Agent
-from aworld.config.conf import AgentConfig
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
 
 from ..mcp_config import MCP_CONFIG
 
+if TYPE_CHECKING:
+    from aworld.config.conf import AgentConfig
+
+# Non-cryptographic source for message/task/order IDs, seeded once per process
+_id_rng = random.Random(os.urandom(16))
+
+
+def _fast_id() -> str:
+    """Generate a random 128-bit hex identifier without UUID overhead"""
+    return format(_id_rng.getrandbits(128), "032x")
+
+
+def _format_ns(timestamp_ns: int) -> str:
+    """Format an epoch-nanoseconds timestamp as ISO 8601 for export"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
 
 class LayerType(StrEnum):
     """Agent layer types for the trading system"""
@@ -47,132 +68,176 @@ class Priority(StrEnum):
     LOW = "low"
 
 
+# Plain string literals for message fields; the StrEnums above compare equal
+# to them, so either form can be passed in without enum coercion
+LayerName = Literal["strategic", "tactical", "execution", "monitoring", "coordination"]
+MessageTypeName = Literal["command", "query", "response", "alert", "heartbeat"]
+PriorityName = Literal["high", "medium", "low"]
+
+# Fixed agent set, in dispatch order; AGENT_INDEX maps a name to its position
+AGENT_NAMES: tuple[str, ...] = (
+    "portfolio_manager",
+    "risk_manager",
+    "strategy_research",
+    "order_execution",
+    "realtime_risk",
+    "task_scheduler",
+)
+AGENT_INDEX: dict[str, int] = {name: idx for idx, name in enumerate(AGENT_NAMES)}
+
+# Maximum number of messages retained on the in-process bus
+MESSAGE_BUS_SIZE = 1024
+
+# Heap rank per priority (lower pops first)
+_PRIORITY_RANK: dict[str, int] = {
+    Priority.HIGH: 0,
+    Priority.MEDIUM: 1,
+    Priority.LOW: 2,
+}
+
+
 class TradingMessage(BaseModel):
     """Standardized message format for trading system communication"""
 
-    message_id: uuid.UUID = Field(default_factory=uuid.uuid4)
-    timestamp: datetime = Field(default_factory=datetime.now)
-    source_layer: LayerType
+    message_id: str = Field(default_factory=_fast_id)
+    timestamp_ns: int = Field(default_factory=time.time_ns)
+    source_layer: LayerName
     source_agent: str
-    target_layer: LayerType
+    target_layer: LayerName
     target_agent: str
-    message_type: MessageType
-    priority: Priority
+    message_type: MessageTypeName
+    priority: PriorityName
     payload: dict[str, Any] = Field(default_factory=dict)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        """Pydantic configuration"""
+    # Messages are immutable once sent; build a new one instead of mutating
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        revalidate_instances="never",
+    )
 
-        use_enum_values = True
-        validate_assignment = True
+    @property
+    def timestamp(self) -> datetime:
+        """Message creation time"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
 
-class RiskMetrics(BaseModel):
+class RiskMetrics(TypedDict):
     """Risk assessment metrics"""
 
-    portfolio_var: float = Field(ge=0, description="Portfolio Value at Risk")
-    expected_shortfall: float = Field(ge=0, description="Expected Shortfall")
-    max_drawdown: float = Field(ge=0, description="Maximum Drawdown")
-    beta: float = Field(description="Portfolio Beta")
-    risk_limits: dict[str, float] = Field(default_factory=dict)
+    portfolio_var: float  # Portfolio Value at Risk
+    expected_shortfall: float  # Expected Shortfall
+    max_drawdown: float  # Maximum Drawdown
+    beta: float  # Portfolio Beta
+    risk_limits: dict[str, float]
 
 
-class Allocation(BaseModel):
+class Allocation(TypedDict):
     """Asset allocation configuration"""
 
-    stocks: float = Field(ge=0, le=1, description="Stock allocation percentage")
-    bonds: float = Field(ge=0, le=1, description="Bond allocation percentage")
-    cash: float = Field(ge=0, le=1, description="Cash allocation percentage")
-    rebalance_trigger: float = Field(
-        ge=0, le=1, description="Rebalancing trigger threshold"
-    )
+    stocks: float  # Stock allocation percentage
+    bonds: float  # Bond allocation percentage
+    cash: float  # Cash allocation percentage
+    rebalance_trigger: float  # Rebalancing trigger threshold
 
-    @field_validator("stocks", "bonds", "cash")
-    @classmethod
-    def validate_allocation_sum(cls, v: float, info: ValidationInfo) -> float:
-        """Ensure allocation percentages sum to 1"""
-        values = info.data
-        total = sum(values.get(k, 0) for k in ["stocks", "bonds", "cash"])
-        if total > 1:
-            raise ValueError("Allocation percentages must sum to <= 1")
-        return v
 
+def validate_allocation(allocation: Allocation) -> Allocation:
+    """Ensure allocation percentages are within [0, 1] and sum to <= 1"""
+    weights = (allocation["stocks"], allocation["bonds"], allocation["cash"])
+    if any(not 0 <= w <= 1 for w in weights):
+        raise ValueError("Allocation percentages must be within [0, 1]")
+    if sum(weights) > 1:
+        raise ValueError("Allocation percentages must sum to <= 1")
+    return allocation
 
-class TradingSignal(BaseModel):
+
+class TradingSignal(TypedDict):
     """Trading signal structure"""
 
     signal: Literal["BUY", "SELL", "HOLD"]
-    confidence: float = Field(ge=0, le=1, description="Signal confidence level")
-    entry_price: float | None = Field(ge=0, description="Entry price for BUY signals")
-    stop_loss: float | None = Field(ge=0, description="Stop loss price")
-    take_profit: float | None = Field(ge=0, description="Take profit price")
-    position_size: float | None = Field(
-        ge=0, le=1, description="Position size as portfolio percentage"
-    )
-    reason: str | None = Field(default=None, description="Reason for HOLD signals")
+    confidence: float  # Signal confidence level
+    entry_price: float | None  # Entry price for BUY signals
+    stop_loss: float | None  # Stop loss price
+    take_profit: float | None  # Take profit price
+    position_size: float | None  # Position size as portfolio percentage
+    reason: NotRequired[str | None]  # Reason for HOLD signals
 
 
-class BacktestStats(BaseModel):
+class BacktestStats(TypedDict):
     """Backtesting performance statistics"""
 
-    sharpe_ratio: float = Field(description="Sharpe ratio")
-    max_drawdown: float = Field(ge=0, description="Maximum drawdown")
-    win_rate: float = Field(ge=0, le=1, description="Winning trade percentage")
-    profit_factor: float = Field(ge=0, description="Profit factor")
+    sharpe_ratio: float  # Sharpe ratio
+    max_drawdown: float  # Maximum drawdown
+    win_rate: float  # Winning trade percentage
+    profit_factor: float  # Profit factor
+
 
+class StrategyPayload(TypedDict, total=False):
+    """Strategy research response payload"""
 
-class OrderPlan(BaseModel):
+    strategy_type: str
+    signals: TradingSignal
+    backtest_stats: BacktestStats
+
+
+class OrderPlan(TypedDict):
     """Order execution plan"""
 
-    order_id: uuid.UUID = Field(default_factory=uuid.uuid4)
-    symbol: str = Field(min_length=1, description="Trading symbol")
-    side: Literal["BUY", "SELL"] = Field(description="Order side")
-    quantity: int = Field(gt=0, description="Order quantity")
-    order_type: str = Field(default="LIMIT", description="Order type")
-    price: float = Field(gt=0, description="Order price")
-    algorithm: str = Field(default="VWAP", description="Execution algorithm")
-    expected_slippage: float = Field(
-        default=0.0, description="Expected slippage percentage"
-    )
-    estimated_fees: float = Field(default=0.0, description="Estimated trading fees")
+    order_id: str
+    symbol: str  # Trading symbol
+    side: Literal["BUY", "SELL"]  # Order side
+    quantity: int  # Order quantity
+    order_type: str
+    price: float  # Order price
+    algorithm: str  # Execution algorithm
+    expected_slippage: float  # Expected slippage percentage
+    estimated_fees: float  # Estimated trading fees
 
 
-class Alert(BaseModel):
+class Alert(TypedDict):
     """System alert structure"""
 
-    type: str = Field(description="Alert type")
-    severity: Literal["LOW", "MEDIUM", "HIGH", "CRITICAL"] = Field(
-        description="Alert severity"
-    )
-    message: str = Field(description="Alert message")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    type: str  # Alert type
+    severity: Literal["LOW", "MEDIUM", "HIGH", "CRITICAL"]  # Alert severity
+    message: str  # Alert message
+    timestamp_ns: int
 
 
-class Task(BaseModel):
+@dataclass(slots=True)
+class Task:
     """Scheduled task structure"""
 
-    task_id: uuid.UUID = Field(default_factory=uuid.uuid4)
-    task_type: str = Field(description="Task type identifier")
-    priority: Priority
-    created_at: datetime = Field(default_factory=datetime.now)
-    status: Literal["queued", "processing", "completed", "failed"] = Field(
-        default="queued"
-    )
-    payload: dict[str, Any] = Field(default_factory=dict)
+    task_type: str  # Task type identifier
+    priority: PriorityName
+    task_id: str = field(default_factory=_fast_id)
+    created_at_ns: int = field(default_factory=time.time_ns)
+    status: Literal["queued", "processing", "completed", "failed"] = "queued"
+    payload: dict[str, Any] = field(default_factory=dict)
 
 
-class AgentState(BaseModel):
+@dataclass(slots=True)
+class AgentState:
     """Agent state tracking"""
 
     agent_id: str
     name: str
-    layer: LayerType
-    status: Literal["idle", "processing", "error", "maintenance"] = Field(
-        default="idle"
-    )
-    last_activity: datetime = Field(default_factory=datetime.now)
-    memory_usage: dict[str, Any] = Field(default_factory=dict)
+    layer: LayerName
+    status: Literal["idle", "processing", "error", "maintenance"] = "idle"
+    last_activity_ns: int = field(default_factory=time.time_ns)
+    memory_usage: dict[str, Any] = field(default_factory=dict)
+
+
+@functools.cache
+def _mcp_config_for(servers: tuple[str, ...]) -> dict[str, Any]:
+    """Subset of MCP_CONFIG for the given servers, built once per combination"""
+    return {
+        "mcpServers": {
+            name: MCP_CONFIG["mcpServers"][name]
+            for name in servers
+            if name in MCP_CONFIG["mcpServers"]
+        }
+    }
 
 
 class TradingAgent(ABC):
@@ -182,7 +247,7 @@ class TradingAgent(ABC):
         self,
         name: str,
         layer: LayerType,
-        config: AgentConfig,
+        config: "AgentConfig",
         system_prompt: str = "",
         tools: list[str] | None = None,
     ) -> None:
@@ -192,10 +257,19 @@ class TradingAgent(ABC):
         self.config = config
         self.system_prompt = system_prompt
         self.tools = tools or []
-        self.state = "idle"
-        self.memory: dict[str, Any] = {}
+        # In-flight message count and the error of the most recent message,
+        # maintained by the system
+        self.pending: int = 0
+        self.last_error: str | None = None
+        self.memory: dict[str, dict[str, Any]] = {}
+
+        # Create underlying LLM agent; aworld is imported lazily so that
+        # importing the message schema alone stays cheap
+        from aworld.agents.llm_agent import Agent  # noqa: PLC0415
+        from aworld.tools.mcp_tool.async_mcp_tool import (  # noqa: F401, PLC0415
+            McpTool,  # must: register mcp tool
+        )
 
-        # Create underlying LLM agent
         self.llm_agent = Agent(
             agent_id=self.agent_id,
             name=name,
@@ -203,30 +277,36 @@ class TradingAgent(ABC):
             conf=config,
             system_prompt=system_prompt,
             mcp_servers=tools,
-            mcp_config=MCP_CONFIG,
+            mcp_config=_mcp_config_for(tuple(self.tools)),
         )
 
-    async def process_message(self, message: TradingMessage) -> TradingMessage:
-        """Process incoming message with error handling"""
-        try:
-            self.state = "processing"
-
-            # Record message to memory
-            self.memory[str(message.message_id)] = {
-                "received": message.model_dump(),
-                "processed_at": datetime.now().isoformat(),
-            }
+    @property
+    def state(self) -> Literal["idle", "processing", "error"]:
+        """Current agent status from the in-flight counter and last message"""
+        if self.pending:
+            return "processing"
+        return "error" if self.last_error is not None else "idle"
 
-            # Process logic implemented by subclasses
-            response = await self._process_logic(message)
+    async def process_message(self, message: TradingMessage) -> TradingMessage:
+        """Process incoming message; errors propagate to the caller"""
+        # Record message to memory (serialized lazily in dump_memory)
+        self.memory[message.message_id] = {
+            "received": message,
+            "processed_at": time.time_ns(),
+        }
 
-            self.state = "idle"
-            return response
+        # Process logic implemented by subclasses
+        return await self._process_logic(message)
 
-        except Exception as e:
-            logging.error(f"Agent {self.name} processing error: {e}")
-            self.state = "error"
-            return self._create_error_response(message, str(e))
+    def dump_memory(self) -> dict[str, dict[str, Any]]:
+        """Serialize recorded messages for auditing"""
+        return {
+            message_id: {
+                "received": record["received"].model_dump(),
+                "processed_at": _format_ns(record["processed_at"]),
+            }
+            for message_id, record in self.memory.items()
+        }
 
     @abstractmethod
     async def _process_logic(self, message: TradingMessage) -> TradingMessage:
@@ -239,7 +319,10 @@ class TradingAgent(ABC):
         message_type: MessageType = MessageType.RESPONSE,
     ) -> TradingMessage:
         """Create response message"""
-        return TradingMessage(
+        # Trusted internal data: skip validation (defaults must be explicit)
+        return TradingMessage.model_construct(
+            message_id=_fast_id(),
+            timestamp_ns=time.time_ns(),
             source_layer=self.layer,
             source_agent=self.name,
             target_layer=original_message.source_layer,
@@ -247,7 +330,7 @@ class TradingAgent(ABC):
             message_type=message_type,
             priority=original_message.priority,
             payload=payload,
-            metadata={"response_to": str(original_message.message_id)},
+            metadata={"response_to": original_message.message_id},
         )
 
     def _create_error_response(
@@ -264,7 +347,7 @@ class TradingAgent(ABC):
 class PortfolioManagerAgent(TradingAgent):
     """Portfolio management agent for strategic layer"""
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: "AgentConfig") -> None:
         super().__init__(
             name="PortfolioManager",
             layer=LayerType.STRATEGIC,
@@ -286,21 +369,22 @@ class PortfolioManagerAgent(TradingAgent):
         """Process portfolio management logic"""
         if message.message_type == MessageType.QUERY:
             # Generate allocation based on market conditions
-            allocation = Allocation(
-                stocks=0.6,
-                bonds=0.3,
-                cash=0.1,
-                rebalance_trigger=0.05,
-            )
+            allocation: Allocation = {
+                "stocks": 0.6,
+                "bonds": 0.3,
+                "cash": 0.1,
+                "rebalance_trigger": 0.05,
+            }
+            validate_allocation(allocation)
 
             return self._create_response(
                 message,
                 {
-                    "allocation": allocation.model_dump(),
+                    "allocation": allocation,
                     "expected_return": 0.08,
                     "expected_volatility": 0.15,
                     "sharpe_ratio": 0.53,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp_ns": time.time_ns(),
                 },
             )
 
@@ -312,7 +396,7 @@ class PortfolioManagerAgent(TradingAgent):
 class RiskManagerAgent(TradingAgent):
     """Risk management agent for strategic layer"""
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: "AgentConfig") -> None:
         super().__init__(
             name="RiskManager",
             layer=LayerType.STRATEGIC,
@@ -333,22 +417,22 @@ class RiskManagerAgent(TradingAgent):
     async def _process_logic(self, message: TradingMessage) -> TradingMessage:
         """Process risk management logic"""
         # Calculate risk metrics
-        risk_metrics = RiskMetrics(
-            portfolio_var=0.02,  # 2% daily VaR
-            expected_shortfall=0.035,
-            max_drawdown=0.15,
-            beta=1.1,
-            risk_limits={
+        risk_metrics: RiskMetrics = {
+            "portfolio_var": 0.02,  # 2% daily VaR
+            "expected_shortfall": 0.035,
+            "max_drawdown": 0.15,
+            "beta": 1.1,
+            "risk_limits": {
                 "max_position_size": 0.1,
                 "max_sector_exposure": 0.25,
                 "stop_loss": 0.05,
             },
-        )
+        }
 
         return self._create_response(
             message,
             {
-                "risk_metrics": risk_metrics.model_dump(),
+                "risk_metrics": risk_metrics,
                 "risk_status": "within_limits",
                 "recommendations": [
                     "Consider reducing tech sector exposure",
@@ -362,7 +446,7 @@ class RiskManagerAgent(TradingAgent):
 class StrategyResearchAgent(TradingAgent):
     """Strategy research agent for tactical layer"""
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: "AgentConfig") -> None:
         super().__init__(
             name="StrategyResearch",
             layer=LayerType.TACTICAL,
@@ -389,37 +473,35 @@ class StrategyResearchAgent(TradingAgent):
         strategy_type = message.payload.get("strategy_type", "momentum")
 
         # Generate trading signal based on strategy type
-        signal = TradingSignal(
-            signal="BUY",
-            confidence=0.75,
-            entry_price=100.0,
-            stop_loss=95.0,
-            take_profit=110.0,
-            position_size=0.05,
-        )
+        signal: TradingSignal = {
+            "signal": "BUY",
+            "confidence": 0.75,
+            "entry_price": 100.0,
+            "stop_loss": 95.0,
+            "take_profit": 110.0,
+            "position_size": 0.05,
+        }
 
         # Backtest statistics
-        backtest_stats = BacktestStats(
-            sharpe_ratio=1.2,
-            max_drawdown=0.08,
-            win_rate=0.65,
-            profit_factor=1.5,
-        )
+        backtest_stats: BacktestStats = {
+            "sharpe_ratio": 1.2,
+            "max_drawdown": 0.08,
+            "win_rate": 0.65,
+            "profit_factor": 1.5,
+        }
 
-        return self._create_response(
-            message,
-            {
-                "strategy_type": strategy_type,
-                "signals": signal.model_dump(),
-                "backtest_stats": backtest_stats.model_dump(),
-            },
-        )
+        payload: StrategyPayload = {
+            "strategy_type": strategy_type,
+            "signals": signal,
+            "backtest_stats": backtest_stats,
+        }
+        return self._create_response(message, payload)
 
 
 class OrderExecutionAgent(TradingAgent):
     """Order execution agent for execution layer"""
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: "AgentConfig") -> None:
         super().__init__(
             name="OrderExecution",
             layer=LayerType.EXECUTION,
@@ -442,17 +524,22 @@ class OrderExecutionAgent(TradingAgent):
         order_request = message.payload.get("order", {})
 
         # Create execution plan
-        order_plan = OrderPlan(
-            symbol=order_request.get("symbol", "AAPL"),
-            side=order_request.get("side", "BUY"),
-            quantity=order_request.get("quantity", 100),
-            price=order_request.get("price", 100.0),
-        )
+        order_plan: OrderPlan = {
+            "order_id": _fast_id(),
+            "symbol": order_request.get("symbol", "AAPL"),
+            "side": order_request.get("side", "BUY"),
+            "quantity": order_request.get("quantity", 100),
+            "order_type": "LIMIT",
+            "price": order_request.get("price", 100.0),
+            "algorithm": "VWAP",
+            "expected_slippage": 0.0,
+            "estimated_fees": 0.0,
+        }
 
         return self._create_response(
             message,
             {
-                "execution_plan": order_plan.model_dump(),
+                "execution_plan": order_plan,
                 "status": "pending_execution",
                 "estimated_completion": "2024-01-01T10:30:00Z",
             },
@@ -462,7 +549,7 @@ class OrderExecutionAgent(TradingAgent):
 class RealTimeRiskAgent(TradingAgent):
     """Real-time risk monitoring agent for monitoring layer"""
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: "AgentConfig") -> None:
         super().__init__(
             name="RealTimeRisk",
             layer=LayerType.MONITORING,
@@ -483,24 +570,26 @@ class RealTimeRiskAgent(TradingAgent):
     async def _process_logic(self, message: TradingMessage) -> TradingMessage:
         """Process real-time risk monitoring logic"""
         # Calculate real-time risk
+        alerts: list[Alert] = [
+            {
+                "type": "POSITION_SIZE",
+                "severity": "MEDIUM",
+                "message": "Tech sector exposure approaching limit",
+                "timestamp_ns": time.time_ns(),
+            }
+        ]
         risk_check = {
             "current_var": 0.018,
             "exposure_check": "PASSED",
             "margin_usage": 0.65,
-            "alerts": [
-                Alert(
-                    type="POSITION_SIZE",
-                    severity="MEDIUM",
-                    message="Tech sector exposure approaching limit",
-                ).model_dump()
-            ],
+            "alerts": alerts,
         }
 
         return self._create_response(
             message,
             {
                 "risk_status": risk_check,
-                "action_required": len(risk_check["alerts"]) > 0,
+                "action_required": bool(alerts),
                 "next_check": "2024-01-01T10:05:00Z",
             },
         )
@@ -509,7 +598,7 @@ class RealTimeRiskAgent(TradingAgent):
 class TaskSchedulerAgent(TradingAgent):
     """Task scheduling agent for coordination layer"""
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: "AgentConfig") -> None:
         super().__init__(
             name="TaskScheduler",
             layer=LayerType.COORDINATION,
@@ -526,7 +615,9 @@ class TaskSchedulerAgent(TradingAgent):
             """,
             tools=["think"],
         )
-        self.task_queue: list[Task] = []
+        # Min-heap of (priority rank, insertion seq, task)
+        self.task_queue: list[tuple[int, int, Task]] = []
+        self._task_seq = itertools.count()
         self.agent_registry: dict[str, AgentState] = {}
 
     async def _process_logic(self, message: TradingMessage) -> TradingMessage:
@@ -541,16 +632,16 @@ class TaskSchedulerAgent(TradingAgent):
                 payload=task_data,
             )
 
-            # Add to task queue
-            self.task_queue.append(task)
-
-            # Sort by priority
-            self.task_queue.sort(key=lambda t: t.priority, reverse=True)
+            # Add to task queue ordered by priority, FIFO within a priority
+            heapq.heappush(
+                self.task_queue,
+                (_PRIORITY_RANK[task.priority], next(self._task_seq), task),
+            )
 
             return self._create_response(
                 message,
                 {
-                    "task_id": str(task.task_id),
+                    "task_id": task.task_id,
                     "queue_position": len(self.task_queue),
                     "estimated_start": "2024-01-01T10:01:00Z",
                 },
@@ -560,8 +651,15 @@ class TaskSchedulerAgent(TradingAgent):
             message, {"status": "scheduler_active", "queue_size": len(self.task_queue)}
         )
 
+    def next_task(self) -> Task | None:
+        """Pop the highest-priority queued task"""
+        if not self.task_queue:
+            return None
+        return heapq.heappop(self.task_queue)[2]
+
 
-class TradingWorkflowResult(BaseModel):
+@dataclass(slots=True)
+class TradingWorkflowResult:
     """Result structure for complete trading workflow"""
 
     portfolio_allocation: dict[str, Any] | None = None
@@ -570,7 +668,7 @@ class TradingWorkflowResult(BaseModel):
     execution_plan: dict[str, Any] | None = None
     risk_monitoring: dict[str, Any] | None = None
     success: bool = True
-    errors: list[str] = []
+    errors: list[str] = field(default_factory=list)
 
 
 class TradingMultiAgentSystem:
@@ -579,10 +677,13 @@ class TradingMultiAgentSystem:
     with Pydantic-based configuration
     """
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: "AgentConfig") -> None:
         self.config = config
         self.agents: dict[str, TradingAgent] = {}
-        self.message_bus: list[TradingMessage] = []
+        # Bounded in-process bus; oldest messages are dropped when full
+        self.message_bus: asyncio.Queue[TradingMessage] = asyncio.Queue(
+            maxsize=MESSAGE_BUS_SIZE
+        )
         self.system_status: str = "initialized"
         self.agent_registry: dict[str, AgentState] = {}
 
@@ -591,21 +692,29 @@ class TradingMultiAgentSystem:
 
     def _initialize_agents(self) -> None:
         """Initialize all trading agents"""
-        # Strategic layer
-        self.agents["portfolio_manager"] = PortfolioManagerAgent(self.config)
-        self.agents["risk_manager"] = RiskManagerAgent(self.config)
-
-        # Tactical layer
-        self.agents["strategy_research"] = StrategyResearchAgent(self.config)
-
-        # Execution layer
-        self.agents["order_execution"] = OrderExecutionAgent(self.config)
-
-        # Monitoring layer
-        self.agents["realtime_risk"] = RealTimeRiskAgent(self.config)
+        agent_classes: dict[str, type[TradingAgent]] = {
+            # Strategic layer
+            "portfolio_manager": PortfolioManagerAgent,
+            "risk_manager": RiskManagerAgent,
+            # Tactical layer
+            "strategy_research": StrategyResearchAgent,
+            # Execution layer
+            "order_execution": OrderExecutionAgent,
+            # Monitoring layer
+            "realtime_risk": RealTimeRiskAgent,
+            # Coordination layer
+            "task_scheduler": TaskSchedulerAgent,
+        }
 
-        # Coordination layer
-        self.agents["task_scheduler"] = TaskSchedulerAgent(self.config)
+        # aworld's Agent rewrites its config dicts in place during construction,
+        # and those include the shared _mcp_config_for result, so agents are
+        # built one at a time
+        for agent_id in AGENT_NAMES:
+            self.agents[agent_id] = agent_classes[agent_id](self.config)
+        # Index-addressable view of the fixed agent set, see AGENT_INDEX
+        self._agent_array: tuple[TradingAgent, ...] = tuple(
+            self.agents[agent_id] for agent_id in AGENT_NAMES
+        )
 
         # Register agent states
         for agent_id, agent in self.agents.items():
@@ -615,13 +724,95 @@ class TradingMultiAgentSystem:
                 layer=agent.layer,
             )
 
+        # Static envelope fields and resolved target index for each workflow step
+        self._msg_templates: dict[str, tuple[dict[str, Any], int]] = {
+            step: (
+                {
+                    "source_layer": LayerType.COORDINATION,
+                    "source_agent": "system",
+                    "target_layer": target_layer,
+                    "target_agent": target_agent,
+                    "message_type": message_type,
+                    "priority": priority,
+                    "metadata": {"workflow_step": step},
+                },
+                AGENT_INDEX[target_agent],
+            )
+            for step, target_layer, target_agent, message_type, priority in (
+                (
+                    "strategic_decision",
+                    LayerType.STRATEGIC,
+                    "portfolio_manager",
+                    MessageType.QUERY,
+                    Priority.HIGH,
+                ),
+                (
+                    "risk_assessment",
+                    LayerType.STRATEGIC,
+                    "risk_manager",
+                    MessageType.QUERY,
+                    Priority.HIGH,
+                ),
+                (
+                    "strategy_generation",
+                    LayerType.TACTICAL,
+                    "strategy_research",
+                    MessageType.QUERY,
+                    Priority.MEDIUM,
+                ),
+                (
+                    "order_execution",
+                    LayerType.EXECUTION,
+                    "order_execution",
+                    MessageType.COMMAND,
+                    Priority.MEDIUM,
+                ),
+                (
+                    "risk_monitoring",
+                    LayerType.MONITORING,
+                    "realtime_risk",
+                    MessageType.QUERY,
+                    Priority.MEDIUM,
+                ),
+            )
+        }
+
         self.system_status = "ready"
 
-    async def send_message(self, message: TradingMessage) -> TradingMessage:
-        """Send message to target agent with validation"""
-        target_agent = self.agents.get(message.target_agent)
+    async def _send_step(self, step: str, payload: dict[str, Any]) -> TradingMessage:
+        """Build a workflow step message from its template and dispatch it"""
+        template, target_idx = self._msg_templates[step]
+        message = TradingMessage.model_construct(
+            message_id=_fast_id(),
+            timestamp_ns=time.time_ns(),
+            payload=payload,
+            **template,
+        )
+        return await self.send_message(message, target_idx)
+
+    def _publish(self, message: TradingMessage) -> None:
+        """Record message on the bus, evicting the oldest one when full"""
+        if self.message_bus.full():
+            self.message_bus.get_nowait()
+        self.message_bus.put_nowait(message)
+
+    async def send_message(
+        self, message: TradingMessage, target_idx: int | None = None
+    ) -> TradingMessage:
+        """Send message to target agent with validation
+
+        Internal callers that already know the target's AGENT_INDEX position
+        pass it as ``target_idx`` to skip the name lookup.
+        """
+        self._publish(message)
+        if target_idx is not None:
+            target_agent = self._agent_array[target_idx]
+        else:
+            target_agent = self.agents.get(message.target_agent)
         if not target_agent:
-            return TradingMessage(
+            return TradingMessage.model_construct(
+                message_id=_fast_id(),
+                timestamp_ns=time.time_ns(),
                 source_layer=LayerType.COORDINATION,
                 source_agent="system",
                 target_layer=message.target_layer,
@@ -629,10 +820,21 @@ class TradingMultiAgentSystem:
                 message_type=MessageType.ALERT,
                 priority=Priority.HIGH,
                 payload={"error": "Agent not found"},
-                metadata={"original_message_id": str(message.message_id)},
+                metadata={"original_message_id": message.message_id},
             )
 
-        return await target_agent.process_message(message)
+        target_agent.pending += 1
+        try:
+            response = await target_agent.process_message(message)
+        except Exception as e:
+            logging.error(f"Agent {target_agent.name} processing error: {e}")
+            target_agent.last_error = str(e)
+            response = target_agent._create_error_response(message, str(e))
+        else:
+            target_agent.last_error = None
+        finally:
+            target_agent.pending -= 1
+        return response
 
     async def execute_trading_workflow(
         self, market_data: dict[str, Any]
@@ -642,92 +844,56 @@ class TradingMultiAgentSystem:
 
         try:
             # 1. Strategic layer decision
-            portfolio_msg = TradingMessage(
-                source_layer=LayerType.COORDINATION,
-                source_agent="system",
-                target_layer=LayerType.STRATEGIC,
-                target_agent="portfolio_manager",
-                message_type=MessageType.QUERY,
-                priority=Priority.HIGH,
-                payload={"market_data": market_data},
-                metadata={"workflow_step": "strategic_decision"},
+            portfolio_response = await self._send_step(
+                "strategic_decision", {"market_data": market_data}
             )
-
-            portfolio_response = await self.send_message(portfolio_msg)
             result.portfolio_allocation = portfolio_response.payload
 
-            # 2. Risk assessment
-            risk_msg = TradingMessage(
-                source_layer=LayerType.COORDINATION,
-                source_agent="system",
-                target_layer=LayerType.STRATEGIC,
-                target_agent="risk_manager",
-                message_type=MessageType.QUERY,
-                priority=Priority.HIGH,
-                payload={"portfolio": portfolio_response.payload},
-                metadata={"workflow_step": "risk_assessment"},
+            # 2. Risk assessment and real-time risk monitoring only depend on
+            # the portfolio decision, so dispatch them concurrently
+            risk_response, risk_monitor_response = await asyncio.gather(
+                self._send_step(
+                    "risk_assessment", {"portfolio": portfolio_response.payload}
+                ),
+                self._send_step(
+                    "risk_monitoring", {"portfolio": portfolio_response.payload}
+                ),
             )
-
-            risk_response = await self.send_message(risk_msg)
             result.risk_assessment = risk_response.payload
+            result.risk_monitoring = risk_monitor_response.payload
 
             # 3. Tactical layer strategy generation
-            strategy_msg = TradingMessage(
-                source_layer=LayerType.COORDINATION,
-                source_agent="system",
-                target_layer=LayerType.TACTICAL,
-                target_agent="strategy_research",
-                message_type=MessageType.QUERY,
-                priority=Priority.MEDIUM,
-                payload={
+            strategy_response = await self._send_step(
+                "strategy_generation",
+                {
                     "market_data": market_data,
                     "risk_limits": risk_response.payload.get("risk_metrics", {}),
                 },
-                metadata={"workflow_step": "strategy_generation"},
             )
-
-            strategy_response = await self.send_message(strategy_msg)
             result.strategy_recommendation = strategy_response.payload
 
             # 4. Execution layer order processing
-            signals = strategy_response.payload.get("signals", {})
-            if isinstance(signals, dict) and signals.get("signal") == "BUY":
-                execution_msg = TradingMessage(
-                    source_layer=LayerType.COORDINATION,
-                    source_agent="system",
-                    target_layer=LayerType.EXECUTION,
-                    target_agent="order_execution",
-                    message_type=MessageType.COMMAND,
-                    priority=Priority.MEDIUM,
-                    payload={
+            strategy_payload: StrategyPayload = strategy_response.payload
+            try:
+                signals = strategy_payload["signals"]
+                is_buy = signals["signal"] == "BUY"
+            except KeyError:
+                # Error responses carry no signals
+                is_buy = False
+            if is_buy:
+                execution_response = await self._send_step(
+                    "order_execution",
+                    {
                         "order": {
                             "symbol": "AAPL",
                             "side": "BUY",
                             "quantity": 100,
-                            "price": signals.get("entry_price", 100.0),
+                            "price": signals["entry_price"],
                         }
                     },
-                    metadata={"workflow_step": "order_execution"},
                 )
-
-                execution_response = await self.send_message(execution_msg)
                 result.execution_plan = execution_response.payload
 
-            # 5. Real-time risk monitoring
-            risk_monitor_msg = TradingMessage(
-                source_layer=LayerType.COORDINATION,
-                source_agent="system",
-                target_layer=LayerType.MONITORING,
-                target_agent="realtime_risk",
-                message_type=MessageType.QUERY,
-                priority=Priority.MEDIUM,
-                payload={"portfolio": portfolio_response.payload},
-                metadata={"workflow_step": "risk_monitoring"},
-            )
-
-            risk_monitor_response = await self.send_message(risk_monitor_msg)
-            result.risk_monitoring = risk_monitor_response.payload
-
         except Exception as e:
             result.success = False
             result.errors.append(str(e))
@@ -741,10 +907,17 @@ class TradingMultiAgentSystem:
             "system_status": self.system_status,
             "total_agents": len(self.agents),
             "agent_states": {
-                agent_id: state.model_dump()
+                agent_id: {
+                    "agent_id": state.agent_id,
+                    "name": state.name,
+                    "layer": state.layer,
+                    "status": self.agents[agent_id].state,
+                    "last_activity": _format_ns(state.last_activity_ns),
+                    "memory_usage": state.memory_usage,
+                }
                 for agent_id, state in self.agent_registry.items()
             },
-            "message_bus_length": len(self.message_bus),
+            "message_bus_length": self.message_bus.qsize(),
             "uptime": datetime.now().isoformat(),
         }
 
@@ -753,6 +926,8 @@ class TradingMultiAgentSystem:
 async def main() -> None:
     """Example usage of the trading multi-agent system"""
     # Initialize system
+    from aworld.config.conf import AgentConfig  # noqa: PLC0415
+
     config = AgentConfig()  # Use appropriate configuration
     system = TradingMultiAgentSystem(config)
 
@@ -772,7 +947,7 @@ async def main() -> None:
     result = await system.execute_trading_workflow(market_data)
 
     print("Trading Workflow Result:")
-    print(json.dumps(result.model_dump(), indent=2, default=str))
+    print(to_json(result, indent=2).decode())
 
 
 if __name__ == "__main__":
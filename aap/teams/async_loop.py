@@ -0,0 +1,58 @@
+import asyncio
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from typing import Any
+
+
+class AsyncLoopThread:
+    """
+    A long-lived event loop running in a daemon thread.
+
+    Sync callers submit coroutines to the shared loop instead of spinning up a
+    fresh loop per call, so concurrent tasks in the same process interleave on
+    one loop and keep loop-bound resources (MCP sessions, HTTP clients) alive.
+    """
+
+    def __init__(self, name: str = "aap-async-loop") -> None:
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the shared event loop, starting its thread on first access.
+        """
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._thread = threading.Thread(
+                        target=loop.run_forever, name=self._name, daemon=True
+                    )
+                    self._thread.start()
+                    self._loop = loop
+        return self._loop
+
+    def submit[T](self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """
+        Schedules a coroutine on the shared loop.
+
+        :param coro: The coroutine to run.
+        :return: A concurrent future resolving to the coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run[T](self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Runs a coroutine on the shared loop and blocks for its result.
+
+        :param coro: The coroutine to run.
+        :param timeout: Seconds to wait before raising TimeoutError.
+        """
+        return self.submit(coro).result(timeout=timeout)
+
+
+ASYNC_LOOP: AsyncLoopThread = AsyncLoopThread()
@@ -0,0 +1,112 @@
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any
+
+from aworld.models.model_response import ModelResponse, ToolCall
+from pydantic_core import from_json, to_json
+
+
+class LLMCache:
+    """
+    Persistent exact-match cache of LLM responses.
+
+    Responses are keyed by a SHA-256 of the endpoint and the fully resolved
+    request (model, messages, tools and sampling parameters), so repeated
+    planner and agent steps with identical context skip the network round-trip
+    entirely. Once more than ``max_entries`` responses are stored, the oldest
+    are evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10_000) -> None:
+        """
+        :param path: Directory holding the cache database.
+        :param max_entries: Responses kept before the oldest are evicted.
+        """
+        self._max_entries = max_entries
+        os.makedirs(path, exist_ok=True)
+        self._db = sqlite3.connect(
+            os.path.join(path, "responses.sqlite3"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB)"
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(base_url: str | None, params: dict[str, Any]) -> str:
+        """
+        Returns the cache key of a resolved request.
+
+        Uses ``json`` for its ``sort_keys`` so equal requests always hash equally.
+
+        :param base_url: Endpoint the request is sent to, so servers exposing
+            the same model name do not share entries.
+        :param params: Resolved request parameters.
+        """
+        payload = json.dumps(
+            [base_url, params], sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> ModelResponse | None:
+        """
+        Returns the cached response for a key, if any.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        data = from_json(row[0])
+        return ModelResponse(
+            id=data["id"],
+            model=data["model"],
+            content=data["content"],
+            tool_calls=[ToolCall.from_dict(call) for call in data["tool_calls"]]
+            if data["tool_calls"]
+            else None,
+            usage=data["usage"],
+            message=data["message"],
+        )
+
+    def set(self, key: str, response: ModelResponse) -> None:
+        """
+        Stores a successful response under a key, evicting the oldest entries
+        past ``max_entries``.
+        """
+        value = to_json(response.to_dict(), fallback=str)
+        with self._lock:
+            # REPLACE reinserts the row, so rowid order is insertion order
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE rowid IN (SELECT rowid FROM responses "
+                "ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+
+@functools.cache
+def llm_cache() -> LLMCache | None:
+    """
+    Returns the process-wide LLM cache, or None unless ``LLM_CACHE_DIR`` is set.
+
+    ``LLM_CACHE_MAX_ENTRIES`` bounds the number of stored responses.
+    """
+    path = os.getenv("LLM_CACHE_DIR")
+    if not path:
+        return None
+    return LLMCache(
+        os.path.expanduser(path),
+        max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000")),
+    )
@@ -0,0 +1,137 @@
+import asyncio
+import importlib.util
+from typing import Any
+
+import httpx
+from aworld.models.llm import register_llm_provider
+from aworld.models.model_response import ModelResponse
+from aworld.models.openai_provider import OpenAIProvider
+from openai import AsyncOpenAI, OpenAI
+
+from aap.tools._loop import LoopLocal
+
+from .llm_cache import LLMCache, llm_cache
+
+SHARED_HTTP_PROVIDER = "openai_shared_http"
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``).
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_LIMITS = httpx.Limits(
+    max_connections=128, max_keepalive_connections=64, keepalive_expiry=300
+)
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Transport retries cover connection failures; retries on 429/5xx responses
+# are handled by the OpenAI SDK's own ``max_retries`` backoff. The async client
+# is kept per event loop, as its connections cannot outlive the loop that
+# opened them.
+SHARED_HTTP: LoopLocal[httpx.AsyncClient] = LoopLocal(
+    lambda: httpx.AsyncClient(
+        timeout=_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(limits=_LIMITS, http2=_HTTP2, retries=3),
+    )
+)
+SHARED_HTTP_SYNC: httpx.Client = httpx.Client(
+    timeout=_TIMEOUT,
+    transport=httpx.HTTPTransport(limits=_LIMITS, http2=_HTTP2, retries=3),
+)
+
+
+class SharedHTTPOpenAIProvider(OpenAIProvider):
+    """
+    OpenAI-compatible provider whose SDK clients share one connection pool.
+
+    Every agent reuses the same keep-alive connections instead of opening its
+    own, so the TLS handshake is paid once per connection rather than once per
+    agent. ``async_provider`` resolves to a client on the running loop's pool,
+    so agents can be awaited from any event loop.
+
+    When ``llm_cache()`` is enabled, non-streaming completions at temperature
+    0 are served from it if an identical request has already been answered.
+    Sampled completions always go to the endpoint so repeated prompts do not
+    replay one frozen answer.
+    """
+
+    def _init_provider(self) -> OpenAI:
+        provider = super()._init_provider()
+        if isinstance(provider, OpenAI):
+            return provider.copy(http_client=SHARED_HTTP_SYNC)
+        return provider
+
+    @property
+    def async_provider(self) -> AsyncOpenAI | None:
+        if self._async_clients is None:
+            return None
+        return self._async_clients.current()
+
+    @async_provider.setter
+    def async_provider(self, provider: AsyncOpenAI | None) -> None:
+        # Set once by the base class with the client from _init_async_provider;
+        # each loop gets a copy of it on that loop's shared connection pool.
+        self._async_clients: LoopLocal[AsyncOpenAI] | None = (
+            None
+            if provider is None
+            else LoopLocal(lambda: provider.copy(http_client=SHARED_HTTP.current()))
+        )
+
+    def _cache_key(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int | None,
+        stop: list[str] | None,
+        **kwargs: Any,
+    ) -> str:
+        params = self.get_openai_params(
+            self.preprocess_messages(messages), temperature, max_tokens, stop, **kwargs
+        )
+        return LLMCache.key(self.base_url, params)
+
+    @staticmethod
+    def _cache_for(temperature: float) -> LLMCache | None:
+        return llm_cache() if temperature == 0 else None
+
+    def completion(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        **kwargs: Any,
+    ) -> ModelResponse:
+        cache = self._cache_for(temperature)
+        if cache is None:
+            return super().completion(messages, temperature, max_tokens, stop, **kwargs)
+        key = self._cache_key(messages, temperature, max_tokens, stop, **kwargs)
+        if (cached := cache.get(key)) is not None:
+            return cached
+        response = super().completion(messages, temperature, max_tokens, stop, **kwargs)
+        if not response.error:
+            cache.set(key, response)
+        return response
+
+    async def acompletion(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        **kwargs: Any,
+    ) -> ModelResponse:
+        cache = self._cache_for(temperature)
+        if cache is None:
+            return await super().acompletion(
+                messages, temperature, max_tokens, stop, **kwargs
+            )
+        key = self._cache_key(messages, temperature, max_tokens, stop, **kwargs)
+        if (cached := await asyncio.to_thread(cache.get, key)) is not None:
+            return cached
+        response = await super().acompletion(
+            messages, temperature, max_tokens, stop, **kwargs
+        )
+        if not response.error:
+            await asyncio.to_thread(cache.set, key, response)
+        return response
+
+
+register_llm_provider(SHARED_HTTP_PROVIDER, SharedHTTPOpenAIProvider)
@@ -1,98 +1,148 @@
-import os
+import functools
+from collections.abc import AsyncIterator
+from typing import Any
 
 from aworld.agents.llm_agent import Agent
-from aworld.config.conf import AgentConfig
+from aworld.config.conf import AgentConfig, TaskConfig
 from aworld.core.agent.swarm import TeamSwarm
-from aworld.core.task import TaskResponse
-from aworld.planner.plan import PlannerOutputParser
+from aworld.core.memory import (
+    AgentMemoryConfig,
+    MemoryBase,
+    MemoryConfig,
+    MemoryLLMConfig,
+)
+from aworld.core.task import Task, TaskResponse
+from aworld.memory.main import InMemoryMemoryStore, MemoryFactory
+from aworld.output.base import Output
 from aworld.runner import Runners
+from aworld.tools.mcp_tool.async_mcp_tool import McpTool  # noqa: F401  # must: register mcp tool
 
+from .agent_descs import (
+    AUDIO_AGENT_DESC,
+    BROWSER_AGENT_DESC,
+    CODE_AGENT_DESC,
+    DOCUMENT_AGENT_DESC,
+    IMAGE_AGENT_DESC,
+    MAIN_AGENT_DESC,
+    SEARCH_AGENT_DESC,
+    THINK_AGENT_DESC,
+    VIDEO_AGENT_DESC,
+)
+from .async_loop import ASYNC_LOOP
+from .llm_http import SHARED_HTTP_PROVIDER
+from .mcp_config import MCP_CONFIG
+from .planner import CompiledPlannerOutputParser
 from .prompts import plan_sys_prompt
+from .settings import SETTINGS
+from .stream_batch import batched
+
+# Unsummarized messages an agent keeps per task before folding them into a
+# running summary.
+MEMORY_WINDOW = 8
+
+
+@functools.cache
+def _agent_config() -> AgentConfig:
+    """
+    Builds the shared LLM configuration from the settings once.
+    """
+    return AgentConfig(
+        llm_provider=SHARED_HTTP_PROVIDER,
+        llm_model_name=SETTINGS.model_name,
+        llm_base_url=SETTINGS.base_url,
+        llm_api_key=SETTINGS.api_key,
+        llm_temperature=SETTINGS.temperature,
+    )
+
+
+@functools.cache
+def _agent_memory_config() -> AgentMemoryConfig:
+    """
+    Builds the short-term memory policy shared by the team's agents.
+
+    Once an agent holds ``MEMORY_WINDOW`` unsummarized messages in a task, aworld
+    replaces them with a running summary, so the context sent on each step
+    stays bounded instead of growing with every step of the swarm.
+    """
+    return AgentMemoryConfig(
+        enable_summary=True,
+        summary_model=SETTINGS.summary_model_name,
+        summary_rounds=MEMORY_WINDOW,
+    )
+
+
+@functools.cache
+def _team_memory() -> MemoryBase:
+    """
+    Builds the memory shared by the team's agents once, configured with the
+    model that writes summaries.
+
+    It is kept apart from aworld's process-wide ``MemoryFactory`` instance, so
+    other agents in the process keep their own memory configuration.
+    """
+    return MemoryFactory.from_config(
+        config=MemoryConfig(
+            provider="aworld",
+            llm_config=MemoryLLMConfig(
+                api_key=SETTINGS.api_key,
+                base_url=SETTINGS.base_url,
+                model_name=SETTINGS.summary_model_name,
+                temperature=0.0,
+            ),
+        ),
+        memory_store=InMemoryMemoryStore(),
+    )
+
+
+class _TeamAgent(Agent):
+    """
+    Agent that uses the team's memory instead of aworld's process-wide one,
+    including the copies aworld makes to run agents in parallel.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.memory = _team_memory()
+
+    def deep_copy(self) -> Agent:
+        agent: Agent = super().deep_copy()
+        agent.memory = self.memory
+        return agent
 
 
 class MultiAgentTeam:
     """
     Represents a team of multi-agent systems.
+
+    Every run gets a freshly built swarm, as aworld swarms keep the task,
+    context and step count of their first run. Only the agent configuration
+    and the team's memory are built once per process and shared.
     """
 
     def __init__(self) -> None:
         """
-        Initializes the MultiAgentTeam with a list of agents.
+        Initializes the MultiAgentTeam with the shared agent configuration.
+        """
+        self.mcp_config = MCP_CONFIG
+        self.agent_config = _agent_config()
 
-        :param agents: Dict of agents in the team.
+    @staticmethod
+    def _build_swarm() -> TeamSwarm:
         """
-        self.mcp_config = {
-            "mcpServers": {
-                # third-party tools
-                "music-analysis": {
-                    "command": "uvx",
-                    "args": ["-n", "mcp-music-analysis"],
-                },
-                "sequential-thinking": {
-                    "command": "npx",
-                    "args": [
-                        "-y",
-                        "@modelcontextprotocol/server-sequential-thinking",
-                    ],
-                },
-                "code": {
-                    "command": "npx",
-                    "args": ["-y", "@e2b/mcp-server"],
-                    "env": {
-                        "E2B_API_KEY": "${E2B_API_KEY}",
-                    },
-                },
-                "terminal": {
-                    "command": "uvx",
-                    "args": ["terminal_controller"],
-                },
-                # agent tools
-                "browser-use": {
-                    "command": "python",
-                    "args": ["-m", "aap.tools.browser.service"],
-                },
-                "document": {
-                    "command": "python",
-                    "args": ["-m", "aap.tools.document.service"],
-                    "env": {
-                        "DATALAB_API_KEY": "${DATALAB_API_KEY}",
-                    },
-                },
-                "search": {
-                    "command": "python",
-                    "args": ["-m", "aap.tools.search.service"],
-                },
-                "image": {
-                    "command": "python",
-                    "args": ["-m", "aap.tools.image.service"],
-                },
-                "video": {
-                    "command": "python",
-                    "args": ["-m", "aap.tools.video.service"],
-                },
-                "think": {
-                    "command": "python",
-                    "args": ["-m", "aap.tools.think.service"],
-                },
-            }
-        }
-        self.agent_config = AgentConfig(
-            llm_model_name=os.getenv(
-                "MODEL_NAME",
-                "google/gemini-2.5-pro",
-            ),
-            llm_base_url=os.getenv("BASE_URL", "https://openrouter.ai/api/v1"),
-            llm_api_key=os.getenv("API_KEY", ""),
-            llm_temperature=float(os.getenv("TEMPERATURE", "1.0")),
-        )
+        Builds the team swarm with one agent per capability, all sharing the
+        team's memory.
+        """
+        agent_config: AgentConfig = _agent_config()
+        memory_config: AgentMemoryConfig = _agent_memory_config()
 
-        main_agent: Agent = Agent(
+        main_agent: Agent = _TeamAgent(
             agent_id="main_agent",
             name="main_agent",
-            desc="main_agent",
-            conf=self.agent_config,
+            desc=MAIN_AGENT_DESC,
+            conf=agent_config,
+            agent_memory_config=memory_config,
             use_tools_in_prompt=True,
-            resp_parse_func=PlannerOutputParser("main_agent").parse,
+            resp_parse_func=CompiledPlannerOutputParser("main_agent").parse,
             system_prompt_template=plan_sys_prompt,
             # system_prompt=(
             #     "You are a leading agent in the multi-agent system. "
@@ -103,78 +153,71 @@ class MultiAgentTeam:
             #     "then reflect on the results and provide a final answer."
             # ),
         )
-        search_agent: Agent = Agent(
-            conf=self.agent_config,
+        search_agent: Agent = _TeamAgent(
+            conf=agent_config,
+            agent_memory_config=memory_config,
             name="search_agent",
-            desc=(
-                "Provide Google search ability to "
-                "fetch relevant documents based on the task."
-            ),
+            desc=SEARCH_AGENT_DESC,
             mcp_servers=["search"],
-            mcp_config=self.mcp_config,
+            mcp_config=MCP_CONFIG,
         )
-        browser_agent: Agent = Agent(
-            conf=self.agent_config,
+        browser_agent: Agent = _TeamAgent(
+            conf=agent_config,
+            agent_memory_config=memory_config,
             name="browser_agent",
-            desc=(
-                "Control a web browser to interact with web pages. "
-                "Could read web content with flexible information gathering."
-            ),
+            desc=BROWSER_AGENT_DESC,
             mcp_servers=["browser-use"],
-            mcp_config=self.mcp_config,
+            mcp_config=MCP_CONFIG,
         )
-        document_agent: Agent = Agent(
-            conf=self.agent_config,
+        document_agent: Agent = _TeamAgent(
+            conf=agent_config,
+            agent_memory_config=memory_config,
             name="document_agent",
-            desc=(
-                "Process document using Datalab SDK with advanced OCR capabilities. "
-                "Convert document to markdown foramt. "
-                "Support PDFs, DOCX, XLSX, PPTX, HTML, and images."
-            ),
+            desc=DOCUMENT_AGENT_DESC,
             mcp_servers=["document"],
-            mcp_config=self.mcp_config,
+            mcp_config=MCP_CONFIG,
         )
-        audio_agent: Agent = Agent(
-            conf=self.agent_config,
+        audio_agent: Agent = _TeamAgent(
+            conf=agent_config,
+            agent_memory_config=memory_config,
             name="audio_agent",
-            desc="Answer audio file related questions.",
+            desc=AUDIO_AGENT_DESC,
             mcp_servers=["music-analysis"],
-            mcp_config=self.mcp_config,
+            mcp_config=MCP_CONFIG,
         )
-        image_agent: Agent = Agent(
-            conf=self.agent_config,
+        image_agent: Agent = _TeamAgent(
+            conf=agent_config,
+            agent_memory_config=memory_config,
             name="image_agent",
-            desc="Answer image file related questions.",
+            desc=IMAGE_AGENT_DESC,
             mcp_servers=["image"],
-            mcp_config=self.mcp_config,
+            mcp_config=MCP_CONFIG,
         )
-        video_agent: Agent = Agent(
-            conf=self.agent_config,
+        video_agent: Agent = _TeamAgent(
+            conf=agent_config,
+            agent_memory_config=memory_config,
             name="video_agent",
-            desc="Answer video file related questions.",
+            desc=VIDEO_AGENT_DESC,
             mcp_servers=["video"],
-            mcp_config=self.mcp_config,
+            mcp_config=MCP_CONFIG,
         )
-        think_agent: Agent = Agent(
-            conf=self.agent_config,
+        think_agent: Agent = _TeamAgent(
+            conf=agent_config,
+            agent_memory_config=memory_config,
             name="think_agent",
-            desc=(
-                "Process complex reasoning tasks with structured output. "
-                "Handles mathematical proofs, programming challenges, "
-                "and logical problems "
-                "while maintaining processing context and metadata."
-            ),
+            desc=THINK_AGENT_DESC,
             mcp_servers=["think"],
-            mcp_config=self.mcp_config,
+            mcp_config=MCP_CONFIG,
         )
-        code_agent: Agent = Agent(
-            conf=self.agent_config,
+        code_agent: Agent = _TeamAgent(
+            conf=agent_config,
+            agent_memory_config=memory_config,
             name="code_agent",
-            desc="Write code to solve problems.",
+            desc=CODE_AGENT_DESC,
             mcp_servers=["code", "terminal"],
-            mcp_config=self.mcp_config,
+            mcp_config=MCP_CONFIG,
         )
-        self.swarm = TeamSwarm(
+        return TeamSwarm(
             main_agent,
             # tool agents
             browser_agent,
@@ -197,12 +240,33 @@ class MultiAgentTeam:
 
         :param task: The task to be executed by the team.
         """
-        result: TaskResponse = Runners.sync_run(
-            task,
-            swarm=self.swarm,
-        )
+        result: TaskResponse = ASYNC_LOOP.run(self.arun(task))
         return result
 
+    async def arun(self, task: str) -> TaskResponse:
+        """
+        Runs the multi-agent team on a given task within the caller's event loop.
+
+        :param task: The task to be executed by the team.
+        """
+        return await Runners.run(task, swarm=self._build_swarm())
+
+    async def astream(
+        self, task: str, window: float = 0.1
+    ) -> AsyncIterator[list[Output]]:
+        """
+        Runs the multi-agent team on a given task, yielding outputs as they
+        are produced, coalesced into batches of at most ``window`` seconds.
+
+        :param task: The task to be executed by the team.
+        :param window: Seconds to collect outputs before forwarding a batch.
+        """
+        streamed = Runners.streamed_run_task(
+            Task(input=task, swarm=self._build_swarm(), conf=TaskConfig(stream=True))
+        )
+        async for chunk in batched(streamed.stream_events(), window):
+            yield chunk
+
 
 if __name__ == "__main__":
     team: MultiAgentTeam = MultiAgentTeam()
@@ -0,0 +1,57 @@
+import logging
+import re
+
+from aworld.core.agent.base import AgentResult
+from aworld.core.common import ActionModel
+from aworld.models.model_response import ModelResponse
+from aworld.planner.models import Plan, StepInfos
+from aworld.planner.plan import PlannerOutputParser
+from pydantic import ValidationError
+
+_PLANNING_RE = re.compile(r"<PLANNING_TAG>(.*?)</PLANNING_TAG>", re.DOTALL)
+_FINAL_ANSWER_RE = re.compile(r"<FINAL_ANSWER_TAG>(.*?)</FINAL_ANSWER_TAG>", re.DOTALL)
+
+
+def _parse_step_infos(step_json: str) -> StepInfos:
+    """
+    Validates the planning JSON into StepInfos in a single pass.
+    """
+    try:
+        return StepInfos.model_validate_json(step_json)
+    except ValidationError as e:
+        logging.error(f"Failed to parse step JSON: {e}")
+        return StepInfos(steps={}, dag=[])
+
+
+class CompiledPlannerOutputParser(PlannerOutputParser):
+    """
+    PlannerOutputParser with precompiled tag patterns.
+
+    Behaves like the aworld parser, but extracts both tags with module-level
+    patterns, validates the plan JSON directly with pydantic instead of
+    ``json.loads`` followed by ``model_validate``, and does not serialize the
+    plan again just to log it on every response.
+    """
+
+    def parse(self, resp: ModelResponse) -> AgentResult:
+        if not resp or not resp.content:
+            logging.warning("No valid response content!")
+            return AgentResult(actions=[], current_state=None)
+
+        content = resp.content.strip()
+        planning_match = _PLANNING_RE.search(content)
+        final_answer_match = _FINAL_ANSWER_RE.search(content)
+        step_json = planning_match.group(1).strip() if planning_match else ""
+        final_answer = final_answer_match.group(1).strip() if final_answer_match else ""
+
+        if step_json or final_answer:
+            plan = Plan(step_infos=_parse_step_infos(step_json), answer=final_answer)
+            policy_info = plan.model_dump_json()
+        else:
+            policy_info = content
+
+        return AgentResult(
+            actions=[ActionModel(agent_name=self.agent_name, policy_info=policy_info)],
+            current_state=None,
+            is_call_tool=False,
+        )
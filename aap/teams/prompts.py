@@ -1,3 +1,7 @@
+# Templates use aworld's ``{{variable}}`` placeholders, which the agent fills in
+# one substitution pass per step: ``task`` and ``tool_list`` come from the step,
+# everything else (e.g. ``current_date``) from the task context.
+
 # System prompt for the planning agent
 plan_sys_prompt = """## Task
 You are an information search expert. Your goal is to maximize the acquisition of effective information through search task planning and retrieval. Based on the user's question and background information, execute tools to collect information and synthesize it into a final answer.
@@ -13,7 +17,7 @@ You are an information search expert. Your goal is to maximize the acquisition o
 - Source reasoning: Trace user queries back to their sources, with special focus on official websites and officially released information
 - Multi-intent decomposition: If user input contains multiple intents or meanings, search for them separately
 - Information completion: Supplement information omitted or implied in the user's question, replace pronouns with specific entities based on context
-- Time conversion: Current date is {current_date}. Convert relative time expressions to specific dates or date ranges
+- Time conversion: Current date is {{current_date}}. Convert relative time expressions to specific dates or date ranges
 - Semantic completeness: Ensure each query is semantically clear and complete to get precise search results
 - Bilingual search: Many data sources require English searches, so please provide corresponding English information
 
@@ -32,7 +36,7 @@ You are an information search expert. Your goal is to maximize the acquisition o
 - Pine Script Examples: https://www.tradingview.com/scripts/
 
 ## Research Topic
-{task}"""
+{{task}}"""
 
 # System prompt for replanning
 replan_sys_prompt = (
@@ -0,0 +1,39 @@
+import os
+from dataclasses import dataclass
+from typing import Self
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    LLM settings shared by the agent teams.
+
+    Read from the environment (and a ``.env`` file, if present) once at import
+    time, so agent construction never touches ``os.environ``.
+    """
+
+    model_name: str = "google/gemini-2.5-pro"
+    base_url: str = "https://openrouter.ai/api/v1"
+    api_key: str = ""
+    temperature: float = 1.0
+    summary_model_name: str = "google/gemini-2.5-flash"
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """
+        Builds the settings from ``MODEL_NAME``, ``BASE_URL``, ``API_KEY``,
+        ``TEMPERATURE`` and ``SUMMARY_MODEL_NAME``, falling back to the defaults.
+        """
+        load_dotenv()
+        return cls(
+            model_name=os.getenv("MODEL_NAME", cls.model_name),
+            base_url=os.getenv("BASE_URL", cls.base_url),
+            api_key=os.getenv("API_KEY", cls.api_key),
+            temperature=float(os.getenv("TEMPERATURE", str(cls.temperature))),
+            summary_model_name=os.getenv("SUMMARY_MODEL_NAME", cls.summary_model_name),
+        )
+
+
+SETTINGS: Settings = Settings.from_env()
@@ -0,0 +1,46 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+
+async def batched[T](
+    source: AsyncIterator[T], window: float = 0.1, max_items: int = 64
+) -> AsyncIterator[list[T]]:
+    """
+    Coalesces a stream into batches to cut per-item forwarding overhead.
+
+    A batch is flushed ``window`` seconds after its first item arrives, once it
+    holds ``max_items`` items, or when the source is exhausted, so the first
+    chunk is never held back longer than one window.
+
+    :param source: The async iterator to batch.
+    :param window: Seconds to wait for more items after the first of a batch.
+    :param max_items: Item count that flushes a batch immediately.
+    """
+    loop = asyncio.get_running_loop()
+    batch: list[T] = []
+    deadline: float | None = None
+    pending: asyncio.Future[T] | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(source))
+            timeout = None if deadline is None else max(deadline - loop.time(), 0.0)
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if done:
+                future, pending = pending, None
+                try:
+                    batch.append(future.result())
+                except StopAsyncIteration:
+                    break
+                if deadline is None:
+                    deadline = loop.time() + window
+                if len(batch) < max_items:
+                    continue
+            yield batch
+            batch = []
+            deadline = None
+        if batch:
+            yield batch
+    finally:
+        if pending is not None:
+            pending.cancel()
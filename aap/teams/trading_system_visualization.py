@@ -4,14 +4,76 @@
 展示五层智能体系的拓扑逻辑和工作流程
 """
 
-import json
+import copy
+import heapq
+import shutil
+from pathlib import Path
 from typing import Any
 
 import matplotlib.patches as mpatches
-import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.figure import Figure
 from matplotlib.patches import FancyBboxPatch
+from pydantic_core import to_json
+
+# 定义各层智能体
+_AGENTS: dict[str, tuple[str, ...]] = {
+    "strategic": ("PortfolioManager", "RiskManager", "MacroAnalysis"),
+    "tactical": ("StrategyResearch", "MarketAnalysis", "AssetAllocation"),
+    "execution": ("OrderExecution", "PositionManager", "LiquidityManager"),
+    "monitoring": ("RealTimeRisk", "Compliance", "SystemMonitor"),
+    "coordination": (
+        "TaskScheduler",
+        "CommunicationCoordinator",
+        "LearningOptimization",
+    ),
+}
+
+# 定义连接关系（基于实际工作流程）
+_CONNECTIONS: tuple[tuple[str, str], ...] = (
+    # 战略层内部
+    ("PortfolioManager", "RiskManager"),
+    ("RiskManager", "MacroAnalysis"),
+    ("MacroAnalysis", "PortfolioManager"),
+    # 战略层到战术层
+    ("PortfolioManager", "StrategyResearch"),
+    ("RiskManager", "AssetAllocation"),
+    ("MacroAnalysis", "MarketAnalysis"),
+    # 战术层内部
+    ("StrategyResearch", "MarketAnalysis"),
+    ("MarketAnalysis", "AssetAllocation"),
+    ("AssetAllocation", "StrategyResearch"),
+    # 战术层到执行层
+    ("StrategyResearch", "OrderExecution"),
+    ("AssetAllocation", "PositionManager"),
+    ("MarketAnalysis", "LiquidityManager"),
+    # 执行层内部
+    ("OrderExecution", "PositionManager"),
+    ("PositionManager", "LiquidityManager"),
+    ("LiquidityManager", "OrderExecution"),
+    # 执行层到监控层
+    ("OrderExecution", "RealTimeRisk"),
+    ("PositionManager", "Compliance"),
+    ("LiquidityManager", "SystemMonitor"),
+    # 监控层到协调层
+    ("RealTimeRisk", "TaskScheduler"),
+    ("Compliance", "CommunicationCoordinator"),
+    ("SystemMonitor", "LearningOptimization"),
+    # 协调层到各层
+    ("TaskScheduler", "PortfolioManager"),
+    ("CommunicationCoordinator", "StrategyResearch"),
+    ("LearningOptimization", "OrderExecution"),
+    # 监控层反馈
+    ("RealTimeRisk", "RiskManager"),
+    ("Compliance", "PortfolioManager"),
+    ("SystemMonitor", "TaskScheduler"),
+)
+
+# 仪表板是静态页面, 直接复制模板文件而不是每次在内存中拼出整段 HTML
+DASHBOARD_HTML = Path(__file__).with_name("trading_dashboard.html")
 
 
 class TradingSystemVisualizer:
@@ -26,147 +88,133 @@ class TradingSystemVisualizer:
             "monitoring": "#96CEB4",  # 绿色 - 监控层
             "coordination": "#FECA57",  # 黄色 - 协调层
         }
+        self._fig: Figure | None = None
         self._build_network()
+        self._report = self._build_report()
+
+    def _get_fig(self, size: tuple[float, float]) -> Figure:
+        """获取复用的画布 (首次调用时创建, 之后清空并调整尺寸)"""
+        if self._fig is None:
+            self._fig = Figure(figsize=size)
+            FigureCanvasAgg(self._fig)
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(size)
+        return self._fig
 
     def _build_network(self):
         """构建智能体网络拓扑"""
-        # 定义各层智能体
-        agents = {
-            "strategic": ["PortfolioManager", "RiskManager", "MacroAnalysis"],
-            "tactical": ["StrategyResearch", "MarketAnalysis", "AssetAllocation"],
-            "execution": ["OrderExecution", "PositionManager", "LiquidityManager"],
-            "monitoring": ["RealTimeRisk", "Compliance", "SystemMonitor"],
-            "coordination": [
-                "TaskScheduler",
-                "CommunicationCoordinator",
-                "LearningOptimization",
-            ],
+        # 记录各层的节点列表, 避免按层反复筛选节点属性
+        self._layer_nodes: dict[str, list[str]] = {
+            layer: list(agent_list) for layer, agent_list in _AGENTS.items()
         }
 
-        # 添加节点
-        for layer, agent_list in agents.items():
-            for agent in agent_list:
-                self.G.add_node(
-                    agent, layer=layer, color=self.layer_colors[layer], size=2000
-                )
-
-        # 定义连接关系（基于实际工作流程）
-        connections = [
-            # 战略层内部
-            ("PortfolioManager", "RiskManager"),
-            ("RiskManager", "MacroAnalysis"),
-            ("MacroAnalysis", "PortfolioManager"),
-            # 战略层到战术层
-            ("PortfolioManager", "StrategyResearch"),
-            ("RiskManager", "AssetAllocation"),
-            ("MacroAnalysis", "MarketAnalysis"),
-            # 战术层内部
-            ("StrategyResearch", "MarketAnalysis"),
-            ("MarketAnalysis", "AssetAllocation"),
-            ("AssetAllocation", "StrategyResearch"),
-            # 战术层到执行层
-            ("StrategyResearch", "OrderExecution"),
-            ("AssetAllocation", "PositionManager"),
-            ("MarketAnalysis", "LiquidityManager"),
-            # 执行层内部
-            ("OrderExecution", "PositionManager"),
-            ("PositionManager", "LiquidityManager"),
-            ("LiquidityManager", "OrderExecution"),
-            # 执行层到监控层
-            ("OrderExecution", "RealTimeRisk"),
-            ("PositionManager", "Compliance"),
-            ("LiquidityManager", "SystemMonitor"),
-            # 监控层到协调层
-            ("RealTimeRisk", "TaskScheduler"),
-            ("Compliance", "CommunicationCoordinator"),
-            ("SystemMonitor", "LearningOptimization"),
-            # 协调层到各层
-            ("TaskScheduler", "PortfolioManager"),
-            ("CommunicationCoordinator", "StrategyResearch"),
-            ("LearningOptimization", "OrderExecution"),
-            # 监控层反馈
-            ("RealTimeRisk", "RiskManager"),
-            ("Compliance", "PortfolioManager"),
-            ("SystemMonitor", "TaskScheduler"),
-        ]
+        # 批量添加节点
+        self.G.add_nodes_from(
+            (agent, {"layer": layer, "color": self.layer_colors[layer], "size": 2000})
+            for layer, agent_list in _AGENTS.items()
+            for agent in agent_list
+        )
 
-        # 添加边
-        for source, target in connections:
-            if source in self.G.nodes and target in self.G.nodes:
-                self.G.add_edge(source, target, weight=1.0)
+        # 批量添加边
+        node_set = set(self.G.nodes)
+        self.G.add_edges_from(
+            (
+                (source, target)
+                for source, target in _CONNECTIONS
+                if source in node_set and target in node_set
+            ),
+            weight=1.0,
+        )
 
-    def draw_system_topology(self, save_path: str = "trading_system_topology.png"):
-        """绘制系统拓扑图"""
-        fig, ax = plt.subplots(1, 1, figsize=(20, 16))
+        # 缓存节点数、边数与有向图密度
+        self._n = self.G.number_of_nodes()
+        self._m = self.G.number_of_edges()
+        self._density = self._m / (self._n * (self._n - 1)) if self._n > 1 else 0.0
 
-        # 创建分层布局
-        pos = {}
-        layer_y = {
+        # 图在构建后不再变化, 分层布局只需计算一次
+        self._layer_y = {
             "strategic": 4,
             "tactical": 3,
             "execution": 2,
             "monitoring": 1,
             "coordination": 0,
         }
+        self._pos: dict[str, tuple[float, float]] = {}
+        for layer, agent_list in self._layer_nodes.items():
+            y = self._layer_y[layer]
+            x_positions = np.linspace(1, 9, len(agent_list))
+            for i, agent in enumerate(agent_list):
+                self._pos[agent] = (float(x_positions[i]), y)
+
+        # 图是静态的, 介数中心性只需计算一次
+        self._centrality: dict[str, float] = nx.betweenness_centrality(self.G)
+
+        # 节点坐标与颜色的并行数组, 供一次 scatter 使用
+        nodes = list(self.G.nodes(data=True))
+        self._node_xyc = (
+            np.array([self._pos[agent][0] for agent, _ in nodes]),
+            np.array([self._pos[agent][1] for agent, _ in nodes]),
+            np.array([data["color"] for _, data in nodes]),
+        )
 
-        # 为每层分配x坐标
-        layer_agents = {}
-        for agent, data in self.G.nodes(data=True):
-            layer = data["layer"]
-            if layer not in layer_agents:
-                layer_agents[layer] = []
-            layer_agents[layer].append(agent)
-
-        for layer, agents in layer_agents.items():
-            y = layer_y[layer]
-            x_positions = np.linspace(1, 9, len(agents))
-            for i, agent in enumerate(agents):
-                pos[agent] = (x_positions[i], y)
-
-        # 绘制节点
-        for layer, color in self.layer_colors.items():
-            layer_nodes = [
-                n for n in self.G.nodes() if self.G.nodes[n]["layer"] == layer
-            ]
-            if layer_nodes:
-                nx.draw_networkx_nodes(
-                    self.G,
-                    pos,
-                    nodelist=layer_nodes,
-                    node_color=color,
-                    node_size=2000,
-                    alpha=0.8,
-                    ax=ax,
-                )
-
-        # 绘制边
-        nx.draw_networkx_edges(
-            self.G,
-            pos,
-            arrowstyle="->",
-            arrowsize=20,
-            edge_color="gray",
+    def draw_system_topology(
+        self,
+        save_path: str = "trading_system_topology.png",
+        dpi: int = 150,
+        format: str | None = None,
+    ):
+        """绘制系统拓扑图 (format 为 None 时按文件扩展名推断, 传 "svg" 可跳过栅格化)"""
+        fig = self._get_fig((20, 9.5))
+        ax = fig.add_subplot(111)
+
+        pos = self._pos
+        layer_y = self._layer_y
+
+        # 绘制节点 (所有层的节点一次 scatter 画完)
+        xs, ys, colors = self._node_xyc
+        ax.scatter(xs, ys, c=colors, s=2000, alpha=0.8, zorder=2)
+
+        # 绘制边 (所有边合并为一个 LineCollection, 方向箭头用一次 quiver 画在边的中点)
+        segments = np.array([(pos[u], pos[v]) for u, v in self.G.edges()])
+        ax.add_collection(
+            LineCollection(segments, colors="gray", linewidths=2, alpha=0.6, zorder=1)
+        )
+        midpoints = segments.mean(axis=1)
+        directions = segments[:, 1] - segments[:, 0]
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        ax.quiver(
+            midpoints[:, 0],
+            midpoints[:, 1],
+            directions[:, 0],
+            directions[:, 1],
+            angles="xy",
+            scale_units="xy",
+            scale=5,
+            pivot="mid",
+            color="gray",
             alpha=0.6,
-            width=2,
-            ax=ax,
+            width=0.003,
+            zorder=1,
         )
 
         # 绘制标签
         nx.draw_networkx_labels(self.G, pos, font_size=10, font_weight="bold", ax=ax)
 
-        # 添加层标签背景
-        for layer, y in layer_y.items():
-            bbox = FancyBboxPatch(
-                (0.5, y - 0.3),
-                8,
-                0.6,
-                boxstyle="round,pad=0.1",
-                facecolor=self.layer_colors[layer],
+        # 添加层标签背景 (五个背景框合并为一个 PatchCollection)
+        ax.add_collection(
+            PatchCollection(
+                [
+                    FancyBboxPatch((0.5, y - 0.3), 8, 0.6, boxstyle="round,pad=0.1")
+                    for y in layer_y.values()
+                ],
+                facecolors=[self.layer_colors[layer] for layer in layer_y],
                 alpha=0.2,
-                edgecolor="black",
-                linewidth=2,
+                edgecolors="black",
+                linewidths=2,
             )
-            ax.add_patch(bbox)
+        )
+        for layer, y in layer_y.items():
             ax.text(
                 4.5,
                 y,
@@ -183,8 +231,6 @@ class TradingSystemVisualizer:
         ax.set_title(
             "Trading Multi-Agent System Topology", fontsize=20, weight="bold", pad=20
         )
-        ax.set_aspect("equal")
-        ax.grid(True, alpha=0.3)
 
         # 隐藏坐标轴
         ax.set_xticks([])
@@ -197,486 +243,93 @@ class TradingSystemVisualizer:
         ]
         ax.legend(handles=legend_elements, loc="upper right", bbox_to_anchor=(1.15, 1))
 
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-        plt.close()
+        # 固定边距代替 bbox_inches="tight", 省去裁剪前的一次试渲染; 右侧留给图例
+        fig.subplots_adjust(left=0.02, right=0.86, top=0.93, bottom=0.02)
+        fig.savefig(save_path, dpi=dpi, format=format)
 
         print(f"系统拓扑图已保存到: {save_path}")
 
-    def draw_data_flow(self, save_path: str = "data_flow_diagram.png"):
+    def draw_data_flow(
+        self,
+        save_path: str = "data_flow_diagram.png",
+        dpi: int = 150,
+        format: str | None = None,
+    ):
         """绘制数据流图"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig = self._get_fig((16, 12))
         fig.suptitle("Trading System Data Flow", fontsize=18, weight="bold")
 
-        # 1. 战略决策流程
-        strategic_flow = [
-            "宏观数据 →",
-            "宏观分析 →",
-            "风险评估 →",
-            "投资目标 →",
-            "资产配置",
-        ]
-
-        ax1.text(
-            0.5,
-            0.5,
-            "\n".join(strategic_flow),
-            ha="center",
-            va="center",
-            fontsize=12,
-            weight="bold",
-            bbox=dict(
-                boxstyle="round,pad=0.5",
-                facecolor=self.layer_colors["strategic"],
-                alpha=0.7,
+        # 四个流程框直接画在画布的四个象限 (无需 Axes)
+        flows = [
+            # 1. 战略决策流程
+            (
+                "Strategic Decision Flow",
+                "strategic",
+                (0.25, 0.7),
+                ["宏观数据 →", "宏观分析 →", "风险评估 →", "投资目标 →", "资产配置"],
             ),
-        )
-        ax1.set_title("Strategic Decision Flow", fontsize=14, weight="bold")
-        ax1.set_xlim(0, 1)
-        ax1.set_ylim(0, 1)
-        ax1.axis("off")
-
-        # 2. 战术决策流程
-        tactical_flow = [
-            "市场数据 →",
-            "策略研发 →",
-            "策略验证 →",
-            "市场分析 →",
-            "交易信号",
-        ]
-
-        ax2.text(
-            0.5,
-            0.5,
-            "\n".join(tactical_flow),
-            ha="center",
-            va="center",
-            fontsize=12,
-            weight="bold",
-            bbox=dict(
-                boxstyle="round,pad=0.5",
-                facecolor=self.layer_colors["tactical"],
-                alpha=0.7,
+            # 2. 战术决策流程
+            (
+                "Tactical Decision Flow",
+                "tactical",
+                (0.75, 0.7),
+                ["市场数据 →", "策略研发 →", "策略验证 →", "市场分析 →", "交易信号"],
             ),
-        )
-        ax2.set_title("Tactical Decision Flow", fontsize=14, weight="bold")
-        ax2.set_xlim(0, 1)
-        ax2.set_ylim(0, 1)
-        ax2.axis("off")
-
-        # 3. 执行决策流程
-        execution_flow = [
-            "交易信号 →",
-            "订单执行 →",
-            "流动性评估 →",
-            "执行算法 →",
-            "订单提交",
-        ]
-
-        ax3.text(
-            0.5,
-            0.5,
-            "\n".join(execution_flow),
-            ha="center",
-            va="center",
-            fontsize=12,
-            weight="bold",
-            bbox=dict(
-                boxstyle="round,pad=0.5",
-                facecolor=self.layer_colors["execution"],
-                alpha=0.7,
+            # 3. 执行决策流程
+            (
+                "Execution Decision Flow",
+                "execution",
+                (0.25, 0.25),
+                ["交易信号 →", "订单执行 →", "流动性评估 →", "执行算法 →", "订单提交"],
+            ),
+            # 4. 监控决策流程
+            (
+                "Monitoring Decision Flow",
+                "monitoring",
+                (0.75, 0.25),
+                ["实时数据 →", "风险计算 →", "阈值检查 →", "警报生成 →", "应急处理"],
             ),
-        )
-        ax3.set_title("Execution Decision Flow", fontsize=14, weight="bold")
-        ax3.set_xlim(0, 1)
-        ax3.set_ylim(0, 1)
-        ax3.axis("off")
-
-        # 4. 监控决策流程
-        monitoring_flow = [
-            "实时数据 →",
-            "风险计算 →",
-            "阈值检查 →",
-            "警报生成 →",
-            "应急处理",
         ]
 
-        ax4.text(
-            0.5,
-            0.5,
-            "\n".join(monitoring_flow),
-            ha="center",
-            va="center",
-            fontsize=12,
-            weight="bold",
-            bbox=dict(
-                boxstyle="round,pad=0.5",
-                facecolor=self.layer_colors["monitoring"],
-                alpha=0.7,
-            ),
-        )
-        ax4.set_title("Monitoring Decision Flow", fontsize=14, weight="bold")
-        ax4.set_xlim(0, 1)
-        ax4.set_ylim(0, 1)
-        ax4.axis("off")
+        for title, layer, (x, y), flow in flows:
+            fig.text(x, y + 0.22, title, ha="center", fontsize=14, weight="bold")
+            fig.text(
+                x,
+                y,
+                "\n".join(flow),
+                ha="center",
+                va="center",
+                fontsize=12,
+                weight="bold",
+                bbox={
+                    "boxstyle": "round,pad=0.5",
+                    "facecolor": self.layer_colors[layer],
+                    "alpha": 0.7,
+                },
+            )
 
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-        plt.close()
+        fig.savefig(save_path, dpi=dpi, format=format)
 
         print(f"数据流图已保存到: {save_path}")
 
     def generate_interactive_dashboard(self, save_path: str = "trading_dashboard.html"):
         """生成交互式仪表板"""
-        html_content = """
-<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>交易多智能体系统仪表板</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://d3js.org/d3.v7.min.js"></script>
-    <style>
-        body {
-            font-family: 'Arial', sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .layer-section {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 20px;
-            margin: 20px 0;
-            backdrop-filter: blur(10px);
-        }
-        .agent-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }
-        .agent-card {
-            background: rgba(255, 255, 255, 0.2);
-            border-radius: 10px;
-            padding: 15px;
-            text-align: center;
-            transition: transform 0.3s ease;
-        }
-        .agent-card:hover {
-            transform: translateY(-5px);
-        }
-        .status-indicator {
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            display: inline-block;
-            margin-right: 8px;
-        }
-        .status-active { background-color: #4CAF50; }
-        .status-warning { background-color: #FF9800; }
-        .status-error { background-color: #F44336; }
-        .chart-container {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 20px;
-            margin: 20px 0;
-        }
-        .workflow-timeline {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin: 20px 0;
-        }
-        .timeline-step {
-            flex: 1;
-            text-align: center;
-            padding: 10px;
-            border-radius: 5px;
-            margin: 0 5px;
-            position: relative;
-        }
-        .timeline-step::after {
-            content: '→';
-            position: absolute;
-            right: -15px;
-            top: 50%;
-            transform: translateY(-50%);
-        }
-        .timeline-step:last-child::after {
-            display: none;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🤖 交易多智能体系统仪表板</h1>
-            <p>五层智能体系实时监控面板</p>
-        </div>
-        
-        <!-- 系统概览 -->
-        <div class="layer-section">
-            <h2>📊 系统概览</h2>
-            <div class="chart-container">
-                <canvas id="systemChart" width="400" height="200"></canvas>
-            </div>
-        </div>
-        
-        <!-- 战略层 -->
-        <div class="layer-section" style="border-left: 5px solid #FF6B6B;">
-            <h2>🏛️ 战略层 (Strategic Layer)</h2>
-            <div class="agent-grid">
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>投资组合管理</h4>
-                    <p>资产配置: 60/30/10</p>
-                    <small>夏普比率: 1.25</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>风险管理</h4>
-                    <p>VaR: 2.1%</p>
-                    <small>状态: 正常</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-warning"></div>
-                    <h4>宏观分析</h4>
-                    <p>市场情绪: 谨慎</p>
-                    <small>更新: 5分钟前</small>
-                </div>
-            </div>
-        </div>
-        
-        <!-- 战术层 -->
-        <div class="layer-section" style="border-left: 5px solid #4ECDC4;">
-            <h2>⚔️ 战术层 (Tactical Layer)</h2>
-            <div class="agent-grid">
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>策略研发</h4>
-                    <p>信号: 买入</p>
-                    <small>置信度: 75%</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>市场分析</h4>
-                    <p>趋势: 上升</p>
-                    <small>强度: 中等</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>资产配置</h4>
-                    <p>权重: 优化中</p>
-                    <small>目标: 最大夏普</small>
-                </div>
-            </div>
-        </div>
-        
-        <!-- 执行层 -->
-        <div class="layer-section" style="border-left: 5px solid #45B7D1;">
-            <h2>🚀 执行层 (Execution Layer)</h2>
-            <div class="agent-grid">
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>订单执行</h4>
-                    <p>算法: VWAP</p>
-                    <small>进度: 65%</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>仓位管理</h4>
-                    <p>杠杆: 1.2x</p>
-                    <small>状态: 正常</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>流动性管理</h4>
-                    <p>深度: 充足</p>
-                    <small>价差: 0.01%</small>
-                </div>
-            </div>
-        </div>
-        
-        <!-- 监控层 -->
-        <div class="layer-section" style="border-left: 5px solid #96CEB4;">
-            <h2>👁️ 监控层 (Monitoring Layer)</h2>
-            <div class="agent-grid">
-                <div class="agent-card">
-                    <div class="status-indicator status-warning"></div>
-                    <h4>实时风控</h4>
-                    <p>警报: 1个</p>
-                    <small>级别: 中等</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>合规检查</h4>
-                    <p>状态: 合规</p>
-                    <small>检查: 实时</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>系统监控</h4>
-                    <p>延迟: 2ms</p>
-                    <small>可用性: 99.9%</small>
-                </div>
-            </div>
-        </div>
-        
-        <!-- 协调层 -->
-        <div class="layer-section" style="border-left: 5px solid #FECA57;">
-            <h2>🎯 协调层 (Coordination Layer)</h2>
-            <div class="agent-grid">
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>任务调度</h4>
-                    <p>队列: 3个任务</p>
-                    <small>优先级: 动态</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>通信协调</h4>
-                    <p>消息: 156条/分钟</p>
-                    <small>延迟: <1ms</small>
-                </div>
-                <div class="agent-card">
-                    <div class="status-indicator status-active"></div>
-                    <h4>学习优化</h4>
-                    <p>模型: 更新中</p>
-                    <small>性能: +2.3%</small>
-                </div>
-            </div>
-        </div>
-        
-        <!-- 工作流程时间线 -->
-        <div class="layer-section">
-            <h2>⏱️ 工作流程时间线</h2>
-            <div class="workflow-timeline">
-                <div class="timeline-step" style="background: #FF6B6B;">
-                    <strong>战略决策</strong><br>
-                    <small>资产配置</small>
-                </div>
-                <div class="timeline-step" style="background: #4ECDC4;">
-                    <strong>战术制定</strong><br>
-                    <small>策略生成</small>
-                </div>
-                <div class="timeline-step" style="background: #45B7D1;">
-                    <strong>执行实施</strong><br>
-                    <small>订单执行</small>
-                </div>
-                <div class="timeline-step" style="background: #96CEB4;">
-                    <strong>监控反馈</strong><br>
-                    <small>风险控制</small>
-                </div>
-                <div class="timeline-step" style="background: #FECA57;">
-                    <strong>协调优化</strong><br>
-                    <small>系统调优</small>
-                </div>
-            </div>
-        </div>
-        
-        <!-- 实时数据图表 -->
-        <div class="layer-section">
-            <h2>📈 实时性能监控</h2>
-            <div class="chart-container">
-                <canvas id="performanceChart" width="400" height="200"></canvas>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // 系统状态图表
-        const ctx1 = document.getElementById('systemChart').getContext('2d');
-        new Chart(ctx1, {
-            type: 'doughnut',
-            data: {
-                labels: ['战略层', '战术层', '执行层', '监控层', '协调层'],
-                datasets: [{
-                    data: [3, 3, 3, 3, 3],
-                    backgroundColor: ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57'],
-                    borderWidth: 2,
-                    borderColor: '#fff'
-                }]
-            },
-            options: {
-                responsive: true,
-                plugins: {
-                    legend: {
-                        position: 'bottom',
-                        labels: { color: 'white' }
-                    }
-                }
-            }
-        });
-
-        // 性能监控图表
-        const ctx2 = document.getElementById('performanceChart').getContext('2d');
-        new Chart(ctx2, {
-            type: 'line',
-            data: {
-                labels: ['00:00', '04:00', '08:00', '12:00', '16:00', '20:00'],
-                datasets: [{
-                    label: '系统响应时间 (ms)',
-                    data: [12, 19, 8, 15, 10, 5],
-                    borderColor: '#4ECDC4',
-                    backgroundColor: 'rgba(78, 205, 196, 0.1)',
-                    tension: 0.4
-                }, {
-                    label: '任务完成率 (%)',
-                    data: [95, 90, 98, 92, 96, 99],
-                    borderColor: '#96CEB4',
-                    backgroundColor: 'rgba(150, 206, 180, 0.1)',
-                    tension: 0.4
-                }]
-            },
-            options: {
-                responsive: true,
-                plugins: {
-                    legend: {
-                        labels: { color: 'white' }
-                    }
-                },
-                scales: {
-                    x: { ticks: { color: 'white' } },
-                    y: { ticks: { color: 'white' } }
-                }
-            }
-        });
-
-        // 实时更新状态
-        setInterval(() => {
-            // 模拟数据更新
-            const now = new Date().toLocaleTimeString();
-            console.log(`系统更新于: ${now}`);
-        }, 5000);
-    </script>
-</body>
-</html>
-        """
-
-        with open(save_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        shutil.copyfile(DASHBOARD_HTML, save_path)
 
         print(f"交互式仪表板已生成: {save_path}")
 
     def generate_system_report(self) -> dict[str, Any]:
-        """生成系统报告"""
+        """生成系统报告 (返回预先构建好的报告的深拷贝, 调用方修改不会影响内部状态)"""
+        return copy.deepcopy(self._report)
+
+    def _build_report(self) -> dict[str, Any]:
+        """构建系统报告 (网络是静态的, 只在初始化时构建一次)"""
         report = {
             "system_overview": {
-                "total_agents": len(self.G.nodes()),
-                "total_connections": len(self.G.edges()),
+                "total_agents": self._n,
+                "total_connections": self._m,
                 "layers": list(self.layer_colors.keys()),
-                "network_density": nx.density(self.G),
+                "network_density": self._density,
             },
             "layer_details": {},
             "critical_paths": [],
@@ -685,27 +338,18 @@ class TradingSystemVisualizer:
 
         # 分析各层
         for layer, color in self.layer_colors.items():
-            layer_nodes = [
-                n for n in self.G.nodes() if self.G.nodes[n]["layer"] == layer
-            ]
+            layer_nodes = self._layer_nodes[layer]
             report["layer_details"][layer] = {
-                "agents": layer_nodes,
+                "agents": list(layer_nodes),
                 "count": len(layer_nodes),
                 "color": color,
             }
 
-        # 识别关键路径
-        try:
-            # 计算中心性
-            centrality = nx.betweenness_centrality(self.G)
-            top_agents = sorted(centrality.items(), key=lambda x: x[1], reverse=True)[
-                :3
-            ]
-            report["critical_paths"] = [
-                {"agent": agent, "centrality": score} for agent, score in top_agents
-            ]
-        except:
-            pass
+        # 识别关键路径 (中心性已在构建网络时算好)
+        top_agents = heapq.nlargest(3, self._centrality.items(), key=lambda x: x[1])
+        report["critical_paths"] = [
+            {"agent": agent, "centrality": score} for agent, score in top_agents
+        ]
 
         # 生成建议
         report["recommendations"] = [
@@ -739,8 +383,7 @@ def main():
     report = visualizer.generate_system_report()
 
     # 保存报告
-    with open("system_report.json", "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    Path("system_report.json").write_bytes(to_json(report, indent=2))
 
     print("\n✅ 可视化生成完成!")
     print("📊 生成的文件:")
@@ -1,29 +1,66 @@
-from .browser import (
-    BrowserResult,
-    complete_browser_task,
-)
-from .document import (
-    DocumentResult,
-    convert_document_to_markdown,
-)
-from .image import (
-    ImageResult,
-    process_image,
-)
-from .search import (
-    GoogleSearchResult,
-    google_search,
-)
-from .think import (
-    ThinkResult,
-    complex_problem_reasoning,
-)
-from .video import (
-    VideoResult,
-    summarize_video,
-    transcribe_and_describe_video,
-    video_qa,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .browser import (
+        BrowserResult,
+        complete_browser_task,
+    )
+    from .document import (
+        DocumentResult,
+        convert_document_to_markdown,
+        convert_documents_to_markdown,
+    )
+    from .image import (
+        ImageResult,
+        process_image,
+    )
+    from .search import (
+        GoogleSearchResult,
+        google_search,
+    )
+    from .think import (
+        ThinkResult,
+        complex_problem_reasoning,
+    )
+    from .video import (
+        VideoResult,
+        bulk_analyze_video,
+        summarize_video,
+        transcribe_and_describe_video,
+        video_qa,
+    )
+
+# Each tool pulls in heavy dependencies (browser drivers, document and media
+# processing), so a tool's subpackage is only imported on first access.
+_LAZY_IMPORTS = {
+    "BrowserResult": ".browser",
+    "complete_browser_task": ".browser",
+    "DocumentResult": ".document",
+    "convert_document_to_markdown": ".document",
+    "convert_documents_to_markdown": ".document",
+    "ImageResult": ".image",
+    "process_image": ".image",
+    "GoogleSearchResult": ".search",
+    "google_search": ".search",
+    "ThinkResult": ".think",
+    "complex_problem_reasoning": ".think",
+    "VideoResult": ".video",
+    "bulk_analyze_video": ".video",
+    "summarize_video": ".video",
+    "transcribe_and_describe_video": ".video",
+    "video_qa": ".video",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BrowserResult",
@@ -32,9 +69,11 @@ __all__ = [
     "ImageResult",
     "ThinkResult",
     "VideoResult",
+    "bulk_analyze_video",
     "complete_browser_task",
     "complex_problem_reasoning",
     "convert_document_to_markdown",
+    "convert_documents_to_markdown",
     "google_search",
     "process_image",
     "summarize_video",
@@ -0,0 +1,12 @@
+import functools
+
+from dotenv import load_dotenv
+
+
+@functools.cache
+def load_env() -> None:
+    """
+    Loads ``.env`` into ``os.environ``, overriding existing values, once per
+    process however many tool modules are imported or reloaded.
+    """
+    load_dotenv(override=True)
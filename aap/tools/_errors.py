@@ -0,0 +1,23 @@
+import os
+import traceback
+
+
+def exception_summary(e: BaseException) -> str:
+    """
+    One-line ``Type: message`` description of ``e``.
+    """
+    return f"{type(e).__name__}: {e}"
+
+
+def exception_errors(e: BaseException) -> list[str]:
+    """
+    Error entries for a tool result: the exception summary, plus the formatted
+    traceback when ``AAP_DEBUG`` is set. Formatting walks every frame, so it is
+    skipped on the normal error path.
+
+    :param e: The exception being handled; call from inside its ``except`` block.
+    """
+    errors = [exception_summary(e)]
+    if os.getenv("AAP_DEBUG"):
+        errors.append(traceback.format_exc())
+    return errors
@@ -0,0 +1,33 @@
+import asyncio
+from collections.abc import Callable
+
+
+class LoopLocal[T]:
+    """
+    One value per event loop, created on first use inside that loop.
+
+    httpx clients and asyncio primitives bind to the loop that first uses them
+    and fail once it is closed, so module-level instances break when a process
+    runs tools under successive loops (repeated ``asyncio.run`` calls, or a
+    fresh loop per test). Values of closed loops are dropped when a new loop
+    first asks for one.
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        """
+        :param factory: Builds the value for a loop.
+        """
+        self._factory = factory
+        self._values: dict[asyncio.AbstractEventLoop, T] = {}
+
+    def current(self) -> T:
+        """
+        Returns the running loop's value, creating it on first use.
+        """
+        loop = asyncio.get_running_loop()
+        value = self._values.get(loop)
+        if value is None:
+            for closed in [other for other in self._values if other.is_closed()]:
+                del self._values[closed]
+            value = self._values[loop] = self._factory()
+        return value
@@ -0,0 +1,107 @@
+import asyncio
+import functools
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+from aap.tools._loop import LoopLocal
+
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+
+
+class _Limiter:
+    """
+    Concurrency cap plus a token bucket refilled at ``max_rpm`` per minute.
+
+    The bucket is shared by every event loop in the process. The semaphore and
+    lock bind to the loop that uses them, so each loop gets its own, and the
+    concurrency cap applies per loop.
+    """
+
+    def __init__(self, max_concurrency: int, max_rpm: int) -> None:
+        self._semaphore: LoopLocal[asyncio.Semaphore] = LoopLocal(
+            lambda: asyncio.Semaphore(max_concurrency)
+        )
+        self._capacity = float(max_rpm)
+        self._tokens = float(max_rpm)
+        self._rate = max_rpm / 60.0
+        self._updated = time.monotonic()
+        self._bucket_lock = threading.Lock()
+        self._lock: LoopLocal[asyncio.Lock] = LoopLocal(asyncio.Lock)
+
+    def _reserve(self) -> float:
+        """
+        Takes a token if one is available and returns 0, or otherwise returns
+        the seconds until the next token.
+        """
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
+
+    async def _take_token(self) -> None:
+        async with self._lock.current():
+            while (wait := self._reserve()) > 0:
+                await asyncio.sleep(wait)
+
+    async def run[T](self, call: Callable[[], Awaitable[T]]) -> T:
+        async with self._semaphore.current():
+            await self._take_token()
+            return await call()
+
+
+_limiters: dict[str, _Limiter] = {}
+
+
+def throttled[**P, T](
+    name: str, max_concurrency: int, max_rpm: int
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """
+    Limits an async tool to ``max_concurrency`` calls in flight and
+    ``max_rpm`` calls started per minute.
+
+    Tools decorated with the same ``name`` share one limit, so it should name
+    the upstream quota (e.g. one API key) rather than the tool; the first
+    decorator registered under a name sets its limits.
+
+    :param name: Key of the shared limit.
+    :param max_concurrency: Calls allowed in flight at once.
+    :param max_rpm: Calls allowed to start per minute.
+    """
+    limiter = _limiters.setdefault(name, _Limiter(max_concurrency, max_rpm))
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            return await limiter.run(lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """
+    Returns how long to wait before retrying a rate-limited request.
+
+    Honors a numeric ``Retry-After`` header when the server sends one, and
+    otherwise uses exponential backoff with full jitter.
+
+    :param attempt: Zero-based index of the attempt that was rate limited.
+    :param retry_after: Value of the response's ``Retry-After`` header.
+    """
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), BACKOFF_CAP)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
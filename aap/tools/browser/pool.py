@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from browser_use import BrowserSession
+from browser_use.browser.profile import BrowserProfile
+
+
+class BrowserPool:
+    """
+    Pool of long-lived browser sessions leased to browser tasks.
+
+    Sessions are kept alive between tasks so that only the first task on each
+    slot pays the browser launch. A session is replaced with a fresh one after
+    ``max_uses`` tasks or when it is no longer connected once a task ends.
+
+    Only the first slot uses the profile's ``user_data_dir``; Chrome cannot
+    open one profile directory from two processes, so any further slots run
+    on temporary profiles.
+
+    Alternatively, ``acquire_context`` gives every task a fresh browser
+    context inside one shared browser, which isolates cookies and storage
+    between tasks without launching a browser per slot.
+
+    Sessions and the pool's asyncio primitives belong to the event loop they
+    were created on. When the pool is first used from a different loop it
+    starts over, and sessions from the previous loop are dropped because that
+    loop can no longer drive them.
+    """
+
+    def __init__(
+        self, browser_profile: BrowserProfile, size: int = 1, max_uses: int = 50
+    ) -> None:
+        """
+        :param browser_profile: Profile every pooled session is launched with.
+        :param size: Number of sessions, i.e. how many tasks run at once.
+        :param max_uses: Tasks a session serves before it is relaunched.
+        """
+        self._browser_profile = browser_profile
+        self._size = size
+        self._max_uses = max_uses
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._idle: asyncio.Queue[tuple[int, BrowserSession]] | None = None
+        self._uses: dict[str, int] = {}
+        self._host: BrowserSession | None = None
+        self._host_lock = asyncio.Lock()
+        self._contexts = asyncio.Semaphore(size)
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._loop is not None:
+            logging.warning("Browser pool used from a new event loop; relaunching")
+        self._loop = loop
+        self._idle = None
+        self._uses = {}
+        self._host = None
+        self._host_lock = asyncio.Lock()
+        self._contexts = asyncio.Semaphore(self._size)
+
+    def _new_session(self, slot: int) -> BrowserSession:
+        update: dict[str, object] = {"keep_alive": True}
+        if slot > 0:
+            update["user_data_dir"] = None
+        profile = self._browser_profile.model_copy(update=update)
+        session = BrowserSession(browser_profile=profile)
+        self._uses[session.id] = 0
+        return session
+
+    def _queue(self) -> asyncio.Queue[tuple[int, BrowserSession]]:
+        self._bind_loop()
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for slot in range(self._size):
+                self._idle.put_nowait((slot, self._new_session(slot)))
+        return self._idle
+
+    async def warm(self) -> None:
+        """
+        Launches every idle session ahead of the first task.
+        """
+        idle = self._queue()
+        leased = [idle.get_nowait() for _ in range(idle.qsize())]
+        results = await asyncio.gather(
+            *(session.start() for _, session in leased), return_exceptions=True
+        )
+        for (slot, session), result in zip(leased, results, strict=True):
+            if isinstance(result, BaseException):
+                logging.warning(f"Browser session {slot} failed to warm up: {result}")
+            idle.put_nowait((slot, session))
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[BrowserSession]:
+        """
+        Leases a started session for the duration of one task.
+        """
+        idle = self._queue()
+        slot, session = await idle.get()
+        try:
+            await session.start()
+            yield session
+        finally:
+            self._uses[session.id] += 1
+            if self._uses[session.id] >= self._max_uses or not (
+                await self._is_connected(session)
+            ):
+                await self._kill(slot, session)
+                session = self._new_session(slot)
+            idle.put_nowait((slot, session))
+
+    async def _host_session(self) -> BrowserSession:
+        async with self._host_lock:
+            if self._host is not None and not await self._is_connected(self._host):
+                await self._kill(0, self._host)
+                self._host = None
+            if self._host is None:
+                self._host = self._new_session(0)
+                await self._host.start()
+            return self._host
+
+    @asynccontextmanager
+    async def acquire_context(self) -> AsyncIterator[BrowserSession]:
+        """
+        Leases a session on a new browser context of the shared browser for
+        the duration of one task; the context is closed afterwards.
+
+        The context starts from the profile's ``storage_state`` rather than
+        its ``user_data_dir``, so logins kept in the Chrome profile are not
+        visible to the task.
+        """
+        self._bind_loop()
+        async with self._contexts:
+            host = await self._host_session()
+            context = await host.browser.new_context(
+                **self._browser_profile.kwargs_for_new_context().model_dump(mode="json")
+            )
+            try:
+                yield BrowserSession(
+                    browser_profile=self._browser_profile.model_copy(
+                        update={"keep_alive": True}
+                    ),
+                    playwright=host.playwright,
+                    browser=host.browser,
+                    browser_context=context,
+                )
+            finally:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logging.warning(f"Failed to close browser context: {e}")
+
+    @staticmethod
+    async def _is_connected(session: BrowserSession) -> bool:
+        try:
+            return await session.is_connected(restart=False)
+        except Exception:
+            return False
+
+    async def _kill(self, slot: int, session: BrowserSession) -> None:
+        self._uses.pop(session.id, None)
+        try:
+            await session.kill()
+        except Exception as e:
+            logging.warning(f"Failed to close browser session {slot}: {e}")
+
+    async def close(self) -> None:
+        """
+        Closes every idle session and the shared context browser.
+        """
+        idle = self._queue()
+        while not idle.empty():
+            slot, session = idle.get_nowait()
+            await self._kill(slot, session)
+        self._idle = None
+        if self._host is not None:
+            await self._kill(0, self._host)
+            self._host = None
@@ -1,24 +1,122 @@
-import base64
+import asyncio
+import binascii
 import os
-import traceback
+from io import BytesIO
 from pathlib import Path
 
-from browser_use import Agent, BrowserSession
-from browser_use.agent.views import AgentHistoryList
+import numpy as np
+from browser_use import Agent
+from browser_use.agent.views import AgentHistoryList, AgentOutput
 from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.views import BrowserStateSummary
 from browser_use.llm import ChatOpenAI
-from dotenv import load_dotenv
 from fastmcp.server.server import FastMCP
+from PIL import Image
 from pydantic import Field
 from pydantic.fields import FieldInfo
 
+from aap.tools._env import load_env
+from aap.tools._errors import exception_errors
+
+from .pool import BrowserPool
 from .prompts import extended_browser_system_prompt
 from .views import BrowserResult
 
-load_dotenv(override=True)
+load_env()
 
 mcp = FastMCP("browser")
 
+BROWSER_PROFILE: BrowserProfile = BrowserProfile(
+    stealth=True,
+    viewport={"width": 1280, "height": 1024},
+    # All elements from the entire page will be included,
+    # regardless of visibility
+    # (highest token usage but most complete).
+    viewport_expansion=-1,
+    # playwright options
+    headless=os.getenv("AAP_HEADLESS") == "1",
+    user_data_dir=Path(
+        "~/.config/browseruse/profiles/default-google-chrome"
+    ).expanduser(),
+    executable_path="/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    user_agent=(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/85.0.4183.102 Safari/537.36"
+    ),
+    highlight_elements=True,
+)
+# Browsers are launched once and reused across tasks.
+BROWSER_POOL = BrowserPool(
+    BROWSER_PROFILE, size=int(os.getenv("AAP_BROWSER_POOL_SIZE", "1"))
+)
+# "context" runs each task in a fresh context of one shared browser instead of
+# leasing a whole pooled browser.
+BROWSER_ISOLATION = os.getenv("AAP_BROWSER_ISOLATION", "session")
+
+
+# Only the latest screenshots are returned in full; consecutive frames whose
+# hashes differ in fewer than SCREENSHOT_MIN_DISTANCE bits count as duplicates.
+SCREENSHOTS_KEPT = 2
+SCREENSHOT_MIN_DISTANCE = 4
+
+
+def _difference_hash(png: bytes) -> int:
+    """
+    64-bit difference hash: one bit per horizontally adjacent pixel pair of
+    the image shrunk to 9x8 grayscale.
+    """
+    with Image.open(BytesIO(png)) as image:
+        pixels = np.asarray(image.convert("L").resize((9, 8)), dtype=np.int16)
+    bits = np.packbits(pixels[:, 1:] > pixels[:, :-1])
+    return int.from_bytes(bits.tobytes(), "big")
+
+
+def _write_screenshot(dest_path: Path, screenshot: str) -> int:
+    """
+    Writes a base64 screenshot to ``dest_path`` and returns its difference
+    hash.
+    """
+    png = binascii.a2b_base64(screenshot)
+    data = memoryview(png)
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+        # Screenshots are written once and not read back here, so keep them
+        # from pushing hotter pages out of the page cache where supported.
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return _difference_hash(png)
+
+
+def _trim_screenshots(frames: list[tuple[Path, int]]) -> tuple[list[str], list[str]]:
+    """
+    Drops frames nearly identical to the frame before them, then keeps the
+    last ``SCREENSHOTS_KEPT`` paths and replaces the rest with text markers.
+
+    :param frames: Screenshot paths with their difference hashes, in step order.
+    :return: Kept screenshot paths and markers for the evicted ones.
+    """
+    distinct: list[tuple[int, Path]] = []
+    previous_hash: int | None = None
+    for idx, (path, frame_hash) in enumerate(frames):
+        if (
+            previous_hash is None
+            or (previous_hash ^ frame_hash).bit_count() >= SCREENSHOT_MIN_DISTANCE
+        ):
+            distinct.append((idx, path))
+        previous_hash = frame_hash
+
+    evicted = distinct[:-SCREENSHOTS_KEPT]
+    kept = distinct[len(evicted) :]
+    return (
+        [str(path) for _, path in kept],
+        [f"[evicted frame {idx + 1}] {path}" for idx, path in evicted],
+    )
+
 
 @mcp.tool(
     description="""Use browser to visit a web page, extract content,
@@ -53,47 +151,50 @@ async def complete_browser_task(
 
     task: str = task.default if isinstance(task, FieldInfo) else task
 
-    browser_profile: BrowserProfile = BrowserProfile(
-        stealth=True,
-        viewport={"width": 1280, "height": 1024},
-        # All elements from the entire page will be included,
-        # regardless of visibility
-        # (highest token usage but most complete).
-        viewport_expansion=-1,
-        # playwright options
-        headless=False,
-        user_data_dir=Path(
-            "~/.config/browseruse/profiles/default-google-chrome"
-        ).expanduser(),
-        executable_path="/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-        user_agent=(
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/85.0.4183.102 Safari/537.36"
-        ),
-        highlight_elements=True,
-    )
-    browser_session: BrowserSession = BrowserSession(browser_profile=browser_profile)
-    agent = Agent(
-        task=task,
-        message_context=message_context.default
-        if isinstance(message_context, FieldInfo)
-        else None,
-        llm=ChatOpenAI(
-            model=os.getenv("MODEL_NAME"),
-            api_key=os.getenv("API_KEY"),
-            base_url=os.getenv("BASE_URL"),
-            temperature=float(os.getenv("LLM_TEMPERATURE", "1.0")),
-        ),
-        extend_system_message=extended_browser_system_prompt,
-        use_vision=True,
-        browser_session=browser_session,
-        save_conversation_path=workspace / "logs/conversation",
-    )
-
     result: BrowserResult = BrowserResult(task=task)
+    # Use task slug and step number for screenshot filenames
+    task_slug = "".join(
+        c if c.isalnum() or c in "-_" else "_" for c in task.lower().replace(" ", "_")
+    )[:40]
+    screenshot_writes: dict[Path, asyncio.Task[int]] = {}
+    history: AgentHistoryList | None = None
+
+    def save_screenshot(
+        state: BrowserStateSummary, model_output: AgentOutput, step: int
+    ) -> None:
+        # Each step's screenshot is decoded and written on a worker thread as
+        # soon as the step is taken, overlapping disk I/O with the agent run.
+        if state.screenshot is None:
+            return
+        dest_path = screenshots_dir / f"{task_slug}_{step}.png"
+        screenshot_writes[dest_path] = asyncio.create_task(
+            asyncio.to_thread(_write_screenshot, dest_path, state.screenshot)
+        )
+
     try:
-        history: AgentHistoryList = await agent.run()
+        async with (
+            BROWSER_POOL.acquire_context()
+            if BROWSER_ISOLATION == "context"
+            else BROWSER_POOL.acquire()
+        ) as browser_session:
+            agent = Agent(
+                task=task,
+                message_context=message_context.default
+                if isinstance(message_context, FieldInfo)
+                else None,
+                llm=ChatOpenAI(
+                    model=os.getenv("MODEL_NAME"),
+                    api_key=os.getenv("API_KEY"),
+                    base_url=os.getenv("BASE_URL"),
+                    temperature=float(os.getenv("LLM_TEMPERATURE", "1.0")),
+                ),
+                extend_system_message=extended_browser_system_prompt,
+                use_vision=True,
+                browser_session=browser_session,
+                save_conversation_path=workspace / "logs/conversation",
+                register_new_step_callback=save_screenshot,
+            )
+            history = await agent.run()
         # status
         is_done: bool = history.is_done()
         has_errors: bool = history.has_errors()
@@ -102,34 +203,38 @@ async def complete_browser_task(
         # assets
         extracted_content: list[str] = history.extracted_content()
         visited_urls: list[str | None] = history.urls()
-        saved_screenshot_paths: list[str] = []
-        for idx, screenshot in enumerate(history.screenshots()):
-            if screenshot is None:
-                continue
-            # Use task slug and index for filename
-            task_slug = "".join(
-                c if c.isalnum() or c in "-_" else "_"
-                for c in task.lower().replace(" ", "_")
-            )[:40]
-            filename = f"{task_slug}_{idx + 1}.png"
-            dest_path = screenshots_dir / filename
-            # Screenshot is always bytes, so write it directly
-            with open(dest_path, "wb") as f:
-                f.write(base64.b64decode(screenshot))
-            saved_screenshot_paths.append(str(dest_path))
+        screenshot_hashes: list[int] = await asyncio.gather(*screenshot_writes.values())
+        saved_screenshot_paths, archived_screenshots = _trim_screenshots(
+            list(zip(screenshot_writes, screenshot_hashes, strict=True))
+        )
 
         result.execution_successful = is_done and not has_errors
         result.task_completion = task_completion
         result.extracted_content = extracted_content[0] if extracted_content else None
-        result.visited_urls = [url for url in visited_urls if url is not None]
+        # Agents revisit pages and repeat errors across steps; keep each once,
+        # in first-seen order.
+        result.visited_urls = list(
+            dict.fromkeys(url for url in visited_urls if url is not None)
+        )
         result.screenshots = saved_screenshot_paths
+        result.screenshots_archived = archived_screenshots
         result.errors = (
-            [error for error in history.errors() if error is not None]
+            list(
+                dict.fromkeys(error for error in history.errors() if error is not None)
+            )
             if has_errors
             else None
         )
-    except Exception:
-        result.errors = history.errors() + [traceback.format_exc()]
+    except Exception as e:
+        # Launch and lease failures happen before the agent has any history.
+        result.errors = (
+            history.errors() if history is not None else []
+        ) + exception_errors(e)
+        # Settle pending screenshot writes so none of their exceptions go
+        # unretrieved.
+        for write in screenshot_writes.values():
+            write.cancel()
+        await asyncio.gather(*screenshot_writes.values(), return_exceptions=True)
     return result
 
 
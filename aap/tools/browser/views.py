@@ -10,4 +10,5 @@ class BrowserResult(BaseModel):
     extracted_content: str | None = None
     visited_urls: list[str] = Field(default_factory=list)
     screenshots: list[str] = Field(default_factory=list)
+    screenshots_archived: list[str] = Field(default_factory=list)
     errors: list[str] | None = None
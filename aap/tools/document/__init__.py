@@ -1,7 +1,8 @@
-from .service import convert_document_to_markdown
+from .service import convert_document_to_markdown, convert_documents_to_markdown
 from .views import DocumentResult
 
 __all__ = [
     "DocumentResult",
     "convert_document_to_markdown",
+    "convert_documents_to_markdown",
 ]
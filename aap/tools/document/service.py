@@ -1,41 +1,55 @@
 import asyncio
 import os
-import traceback
+from http import HTTPStatus
 from pathlib import Path
 
 import filetype
-import requests
+import httpx
 from datalab_sdk.models import ConversionResult, ConvertOptions, OCROptions
-from dotenv import load_dotenv
 from fastmcp.server.server import FastMCP
 from pydantic import Field
 from pydantic.fields import FieldInfo
-from requests.models import Response
 
+from aap.tools._env import load_env
+from aap.tools._errors import exception_errors, exception_summary
+from aap.tools._loop import LoopLocal
+from aap.tools._ratelimit import MAX_RETRIES, backoff_delay, throttled
 from aap.tools.document.views import DocumentEntity, DocumentResult
 
 from .views import DocumentEntity, DocumentResult
 
-load_dotenv(override=True)
+load_env()
 
 mcp = FastMCP("document")
 DATALAB_URL = "https://www.datalab.to/api/v1"
 workspace: Path = Path(os.getenv("AWORLD_WORKSPACE", "~/")) / "processed_documents"
 workspace.mkdir(parents=True, exist_ok=True)
 
+# Shared so that uploads and polls reuse keep-alive connections; one client per
+# event loop, as its connections cannot outlive the loop that opened them.
+_http: LoopLocal[httpx.AsyncClient] = LoopLocal(
+    lambda: httpx.AsyncClient(timeout=httpx.Timeout(120, connect=10))
+)
+
 
 def _prepare_file_entity(file_path: [str | Path]) -> DocumentEntity:
     """
     Prepare a DocumentEntity from the given file path.
+
+    The file is read once; its bytes serve both MIME detection and upload.
     """
     file_path: Path = Path(file_path)
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    resolved_path: Path = file_path.resolve()
+    file_bytes: bytes = resolved_path.read_bytes()
+    kind = filetype.guess(file_bytes)
     return DocumentEntity(
-        file_name=file_path.resolve().name,
-        file_path=file_path.resolve(),
-        file_types=filetype.guess(file_path).mime or "application/pdf",
+        file_name=resolved_path.name,
+        file_path=resolved_path,
+        file_types=kind.mime if kind else "application/pdf",
+        file_bytes=file_bytes,
     )
 
 
@@ -51,49 +65,67 @@ async def _establish_document_session(
         raise ValueError("DATALAB_API_KEY environment variable is not set.")
 
     try:
-        response: Response = requests.post(
-            url=DATALAB_URL + endpoint,
-            files={
-                "file": (
-                    file_entity.file_name,
-                    open(file_entity.file_path, "rb"),
-                    file_entity.file_types,
-                ),
-                "force_ocr": (None, False),
-                "paginate": (
-                    None,
-                    options.paginate if isinstance(options, ConvertOptions) else False,
-                ),
-                "output_format": (None, "markdown"),
-                "use_llm": (
-                    None,
-                    options.use_llm if isinstance(options, ConvertOptions) else False,
-                ),
-                "strip_existing_ocr": (None, False),
-                "disable_image_extraction": (None, False),
-            },
-            headers={"X-Api-Key": os.getenv("DATALAB_API_KEY")},
-            timeout=120,
-        )
+        form: dict[str, str] = {
+            "force_ocr": str(False),
+            "paginate": str(
+                options.paginate if isinstance(options, ConvertOptions) else False
+            ),
+            "output_format": "markdown",
+            "use_llm": str(
+                options.use_llm if isinstance(options, ConvertOptions) else False
+            ),
+            "strip_existing_ocr": str(False),
+            "disable_image_extraction": str(False),
+        }
+        for attempt in range(MAX_RETRIES + 1):
+            response: httpx.Response = await _http.current().post(
+                url=DATALAB_URL + endpoint,
+                files={
+                    "file": (
+                        file_entity.file_name,
+                        file_entity.file_bytes,
+                        file_entity.file_types,
+                    ),
+                },
+                data=form,
+                headers={"X-Api-Key": os.getenv("DATALAB_API_KEY")},
+            )
+            if (
+                response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+                or attempt == MAX_RETRIES
+            ):
+                break
+            await asyncio.sleep(
+                backoff_delay(attempt, response.headers.get("Retry-After"))
+            )
         return response.json()
     except Exception as e:
         raise RuntimeError(
-            f"Failed to establish document session: {traceback.format_exc()}"
+            f"Failed to establish document session: {exception_summary(e)}"
         ) from e
 
 
 async def _poll_result(
     check_url: str,
-    max_polls: int = 300,
-    poll_interval: int = 2,
+    max_wait: float = 600,
+    min_interval: float = 0.5,
+    max_interval: float = 5,
 ) -> ConversionResult:
     """
     Poll the Datalab API for the result of the document processing.
+
+    The interval starts at ``min_interval`` and grows by half each poll up to
+    ``max_interval``, so short conversions are picked up quickly without
+    hammering the API during long ones.
     """
     try:
-        for _ in range(max_polls):
-            await asyncio.sleep(poll_interval)
-            response: Response = requests.get(
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        interval = min_interval
+        while loop.time() < deadline:
+            await asyncio.sleep(interval)
+            interval = min(max_interval, interval * 1.5)
+            response: httpx.Response = await _http.current().get(
                 check_url,
                 headers={"X-Api-Key": os.getenv("DATALAB_API_KEY")},
                 timeout=5,
@@ -115,10 +147,39 @@ async def _poll_result(
         raise TimeoutError("Document processing timed out.")
     except Exception as e:
         raise RuntimeError(
-            f"Failed to poll document result: {traceback.format_exc()}"
+            f"Failed to poll document result: {exception_summary(e)}"
         ) from e
 
 
+@throttled("datalab", max_concurrency=4, max_rpm=60)
+async def _convert_document(file_path: str, paginate: bool) -> DocumentResult:
+    """
+    Upload one document to Datalab and wait for its markdown conversion.
+    """
+    result: DocumentResult = DocumentResult(file_path=file_path)
+    try:
+        file_entity: DocumentEntity = await asyncio.to_thread(
+            _prepare_file_entity, file_path
+        )
+        session: dict = await _establish_document_session(
+            file_entity,
+            options=ConvertOptions(
+                output_format="markdown",
+                paginate=paginate,
+                use_llm=True,
+                max_pages=None,
+            ),
+        )
+        conversion_result: ConversionResult = await _poll_result(
+            session["request_check_url"]
+        )
+        result.conversion_result = conversion_result
+    except Exception as e:
+        result.errors = exception_errors(e)
+
+    return result
+
+
 @mcp.tool(
     description=(
         "Convert document to markdown foramt. "
@@ -142,26 +203,36 @@ async def convert_document_to_markdown(
     if isinstance(paginate, FieldInfo):
         paginate: bool = paginate.default
 
-    result: DocumentResult = DocumentResult(file_path=file_path)
-    try:
-        file_entity: DocumentEntity = _prepare_file_entity(file_path)
-        session: dict = await _establish_document_session(
-            file_entity,
-            options=ConvertOptions(
-                output_format="markdown",
-                paginate=paginate,
-                use_llm=True,
-                max_pages=None,
-            ),
-        )
-        conversion_result: ConversionResult = await _poll_result(
-            session["request_check_url"]
-        )
-        result.conversion_result = conversion_result
-    except Exception as e:
-        result.errors = [traceback.format_exc(), str(e)]
+    return await _convert_document(file_path, paginate)
 
-    return result
+
+@mcp.tool(
+    description=(
+        "Convert several documents to markdown format at once. "
+        "Support PDFs, DOCX, XLSX, PPTX, HTML, and images."
+    )
+)
+async def convert_documents_to_markdown(
+    file_paths: list[str] = Field(..., description="Paths to the document files"),
+    paginate: bool = Field(False, description="Add page delimiters to the output"),
+) -> list[DocumentResult]:
+    """
+    Convert several documents concurrently instead of one tool call each.
+
+    Uploads and polls overlap, bounded by the shared Datalab rate limit.
+
+    Returns one DocumentResult per path, in the order given.
+    """
+    if isinstance(file_paths, FieldInfo):
+        file_paths: list[str] = file_paths.default
+    if isinstance(paginate, FieldInfo):
+        paginate: bool = paginate.default
+
+    return list(
+        await asyncio.gather(
+            *(_convert_document(file_path, paginate) for file_path in file_paths)
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -48,3 +48,6 @@ class DocumentEntity(BaseModel):
         # epub
         "application/epub+zip",
     ] = Field(..., description="MIME type of the document file")
+    file_bytes: bytes = Field(
+        ..., description="Raw content of the document file", exclude=True, repr=False
+    )
@@ -1,23 +1,90 @@
+import asyncio
+import hashlib
 import mimetypes
 import os
-import traceback
-from typing import Any
+from collections import OrderedDict
+from io import BytesIO
 
-import requests
-from dotenv import load_dotenv
+import httpx
 from fastmcp import FastMCP
 from google import genai
 from google.genai import types
+from PIL import Image, UnidentifiedImageError
 from pydantic import Field
 
+from aap.tools._env import load_env
+from aap.tools._errors import exception_errors
+from aap.tools._ratelimit import throttled
 from aap.tools.image.views import ImageResult
 
 from .views import ImageResult
 
-load_dotenv(override=True)
+load_env()
 
 mcp = FastMCP("search")
 
+# Vision token cost grows with pixel count, so images are downscaled and
+# re-encoded before upload.
+IMAGE_MAX_DIM = int(os.getenv("AAP_IMAGE_MAX_DIM", "1024"))
+IMAGE_QUALITY = int(os.getenv("AAP_IMAGE_QUALITY", "70"))
+# Answers to repeated questions about the same images can be served from an
+# in-process LRU cache instead of calling Gemini again. Answers are sampled, so
+# the cache is off (0) unless a size is set.
+RESPONSE_CACHE_SIZE = int(os.getenv("AAP_IMAGE_RESPONSE_CACHE_SIZE", "0"))
+_response_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+
+def _images_key(images: list[tuple[bytes, str]]) -> str:
+    """
+    BLAKE2b digest of the prepared image bytes and MIME types, in order.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for data, mime_type in images:
+        digest.update(f"{mime_type}:{len(data)}:".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _cache_answer(key: tuple[str, str], answer: str) -> None:
+    if RESPONSE_CACHE_SIZE <= 0:
+        return
+    _response_cache[key] = answer
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def _prepare_vision_bytes(data: bytes, uri: str) -> tuple[bytes, str]:
+    """
+    Downscales an image to ``IMAGE_MAX_DIM`` on its long side and re-encodes
+    it as JPEG at ``IMAGE_QUALITY``.
+
+    Returns the encoded bytes and their MIME type. Data Pillow cannot decode
+    is passed through unchanged with the MIME type guessed from ``uri``.
+    """
+    try:
+        image = Image.open(BytesIO(data))
+    except UnidentifiedImageError:
+        return data, mimetypes.guess_type(url=uri)[0] or "image/jpeg"
+    with image:
+        image.thumbnail((IMAGE_MAX_DIM, IMAGE_MAX_DIM))
+        buffer = BytesIO()
+        image.convert("RGB").save(buffer, "JPEG", quality=IMAGE_QUALITY, optimize=True)
+    return buffer.getvalue(), "image/jpeg"
+
+
+def _load_local_image(image_path: str) -> tuple[bytes, str]:
+    with open(file=image_path, mode="rb") as f:
+        return _prepare_vision_bytes(f.read(), image_path)
+
+
+async def _load_remote_image(
+    client: httpx.AsyncClient, image_url: str
+) -> tuple[bytes, str]:
+    response: httpx.Response = await client.get(image_url)
+    response.raise_for_status()
+    return await asyncio.to_thread(_prepare_vision_bytes, response.content, image_url)
+
 
 @mcp.tool(
     description="""Process images with multi-modal reasoning capabilities.
@@ -25,6 +92,7 @@ mcp = FastMCP("search")
     Supports image captioning, classification, and visual question answering
     through Gemini's multi-modal architecture."""
 )
+@throttled("gemini", max_concurrency=4, max_rpm=60)
 async def process_image(
     question: str = Field(
         ..., description="User's question or prompt for image processing"
@@ -49,47 +117,55 @@ async def process_image(
 
     image_parts: list = []
     try:
-        for image_path in image_paths:
-            with open(file=image_path, mode="rb") as f:
-                image_parts.append(
-                    types.Part.from_bytes(
-                        data=f.read(),
-                        mime_type=mimetypes.guess_type(url=image_path)[0]
-                        or "image/jpeg",
-                    )
-                )
-        for image_url in image_urls:
-            image_bytes: bytes | Any = requests.get(image_url, timeout=30).content
-            image_parts.append(
-                types.Part.from_bytes(
-                    data=image_bytes,
-                    mime_type=mimetypes.guess_type(url=image_url)[0] or "image/jpeg",
-                )
+        # Local reads and URL downloads all run concurrently; gather keeps
+        # the parts in paths-then-urls order.
+        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+            images: list[tuple[bytes, str]] = await asyncio.gather(
+                *(asyncio.to_thread(_load_local_image, path) for path in image_paths),
+                *(_load_remote_image(client, url) for url in image_urls),
             )
+        cache_key: tuple[str, str] = (_images_key(images), question)
+        image_parts = [
+            types.Part.from_bytes(data=data, mime_type=mime_type)
+            for data, mime_type in images
+        ]
+        # Only the parts are kept, so clearing them below frees the image bytes.
+        del images
     except Exception as e:
-        result.errors = [str(e), traceback.format_exc()]
+        result.errors = exception_errors(e)
         return result
 
+    total_images: int = len(image_parts)
     try:
-        client: genai.Client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-        response: types.GenerateContentResponse = client.models.generate_content(
-            model="gemini-2.5-pro",
-            contents=[
-                question,
-                *image_parts,  # Include all image parts
-            ],
-        )
-        result.answer = response.text
+        answer: str | None = _response_cache.get(cache_key)
+        if answer is None:
+            client: genai.Client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+            response: types.GenerateContentResponse = client.models.generate_content(
+                model="gemini-2.5-pro",
+                contents=[
+                    question,
+                    *image_parts,  # Include all image parts
+                ],
+            )
+            answer = response.text
+            _cache_answer(cache_key, answer)
+        else:
+            _response_cache.move_to_end(cache_key)
+        result.answer = answer
 
         result.metadata = {
             "model": "google/gemini-2.5-pro",
-            "total_images": len(image_parts),
+            "total_images": total_images,
             "image_uris": image_paths + image_urls,
         }
         result.execution_successful = True
     except Exception as e:
         result.execution_successful = False
-        result.errors = [str(e), traceback.format_exc()]
+        result.errors = exception_errors(e)
+    finally:
+        # The encoded images are not needed once Gemini has answered, so free
+        # them instead of holding them until the result is returned.
+        image_parts.clear()
     return result
 
 
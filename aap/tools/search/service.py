@@ -1,22 +1,34 @@
+import asyncio
 import os
-import traceback
+from http import HTTPStatus
 from typing import Any
 
 import httpx
-from dotenv import load_dotenv
 from fastmcp import FastMCP
-from httpx._models import Response
 from pydantic import Field
 from pydantic.fields import FieldInfo
 
+from aap.tools._env import load_env
+from aap.tools._errors import exception_errors
+from aap.tools._loop import LoopLocal
+from aap.tools._ratelimit import MAX_RETRIES, backoff_delay, throttled
 from aap.tools.search.views import GoogleSearchResult
 
 from .views import Document, GoogleSearchResult
 
-load_dotenv(override=True)
+load_env()
 
 mcp = FastMCP("search")
 
+# Shared so that repeated searches reuse warm keep-alive connections; one client
+# per event loop, as its connections cannot outlive the loop that opened them.
+_http: LoopLocal[httpx.AsyncClient] = LoopLocal(
+    lambda: httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+)
+
 
 @mcp.tool(
     description=(
@@ -24,6 +36,7 @@ mcp = FastMCP("search")
         "and return a list of documents with url and summary."
     ),
 )
+@throttled("google_cse", max_concurrency=4, max_rpm=100)
 async def google_search(
     query: str = Field(..., description="The user query to search for"),
     num_results: int = Field(10, description="Number of search results to return"),
@@ -49,9 +62,19 @@ async def google_search(
             "language": "en",
             "country": "us",
         }
-        response: Response = httpx.get(
-            url="https://www.googleapis.com/customsearch/v1", params=params, timeout=10
-        )
+        for attempt in range(MAX_RETRIES + 1):
+            response: httpx.Response = await _http.current().get(
+                url="https://www.googleapis.com/customsearch/v1",
+                params=params,
+            )
+            if (
+                response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+                or attempt == MAX_RETRIES
+            ):
+                break
+            await asyncio.sleep(
+                backoff_delay(attempt, response.headers.get("Retry-After"))
+            )
         response.raise_for_status()
         data = response.json()
 
@@ -60,8 +83,8 @@ async def google_search(
             Document(url=item.get("link"), summary=item.get("snippet"))
             for item in data.get("items", [])
         ]
-    except Exception:
-        result.errors = [traceback.format_exc()]
+    except Exception as e:
+        result.errors = exception_errors(e)
         result.execution_successful = False
     return result
 
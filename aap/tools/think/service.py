@@ -1,20 +1,20 @@
 import os
 import re
-import traceback
 from typing import Literal
 
 from aworld.config.conf import AgentConfig
 from aworld.models.llm import acall_llm_model, get_llm_model
 from aworld.models.model_response import ModelResponse
-from dotenv import load_dotenv
 from fastmcp import FastMCP
 from pydantic import Field
 
+from aap.tools._env import load_env
+from aap.tools._errors import exception_errors
 from aap.tools.think.views import ThinkResult
 
 from .views import ThinkResult
 
-load_dotenv(override=True)
+load_env()
 
 mcp = FastMCP("think")
 
@@ -23,6 +23,11 @@ mcp = FastMCP("think")
 workspace = os.getenv("AWORLD_WORKSPACE", "~/think_workspace")
 os.makedirs(workspace, exist_ok=True)
 
+# Matches the <think>...</think> and <answer>...</answer> parts of a response
+THINK_ANSWER_PATTERN: re.Pattern[str] = re.compile(
+    r"<think>(.*?)</think>.*?<answer>(.*?)</answer>", re.DOTALL | re.IGNORECASE
+)
+
 
 @mcp.tool(
     description="""Process complex reasoning tasks with structured output.
@@ -70,11 +75,7 @@ async def complex_problem_reasoning(
         )
 
         # Extract <think>...</think> and <answer>...</answer> using regex
-        match: re.Match = re.search(
-            r"<think>(.*?)</think>.*?<answer>(.*?)</answer>",
-            response.content,
-            re.DOTALL | re.IGNORECASE,
-        )
+        match: re.Match = THINK_ANSWER_PATTERN.search(response.content)
         if match:
             think_process: str | None = match.group(1).strip()
             answer: str | None = match.group(2).strip()
@@ -93,7 +94,7 @@ async def complex_problem_reasoning(
         result.execution_successful = True
 
     except Exception as e:
-        result.errors = [str(e), traceback.format_exc()]
+        result.errors = exception_errors(e)
         result.execution_successful = False
 
     return result
@@ -103,25 +104,34 @@ def _prepare_reasoning_prompt(
     question: str,
     original_task: str,
     reasoning_style: Literal["step-by-step", "concise", "detailed"] = "step-by-step",
-) -> str:
-    """Prepare standardized prompt for reasoning tasks"""
-    prompt = (
-        f"Question: {question}\n\nContext: {original_task}"
-        if original_task
-        else question
-    )
+) -> list[dict[str, str]]:
+    """
+    Prepare standardized prompt for reasoning tasks.
+
+    The style instruction and the task context come first as separate
+    messages so calls sharing them also share a cacheable prompt prefix;
+    only the trailing question varies.
+    """
     style_instructions: dict[str, str] = {
-        "step-by-step": "\n\nProvide a clear step-by-step breakdown.",
-        "concise": "\n\nProvide a concise but complete solution.",
-        "detailed": "\n\nProvide detailed analysis with comprehensive reasoning.",
+        "step-by-step": "Provide a clear step-by-step breakdown.",
+        "concise": "Provide a concise but complete solution.",
+        "detailed": "Provide detailed analysis with comprehensive reasoning.",
     }
 
-    return [
+    messages: list[dict[str, str]] = []
+    if reasoning_style in style_instructions:
+        messages.append(
+            {"role": "system", "content": style_instructions[reasoning_style]}
+        )
+    if original_task:
+        messages.append({"role": "user", "content": f"Context: {original_task}"})
+    messages.append(
         {
             "role": "user",
-            "content": prompt + style_instructions.get(reasoning_style, ""),
+            "content": f"Question: {question}" if original_task else question,
         }
-    ]
+    )
+    return messages
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 from .service import (
+    bulk_analyze_video,
     summarize_video,
     transcribe_and_describe_video,
     video_qa,
@@ -7,6 +8,7 @@ from .views import VideoResult
 
 __all__ = [
     "VideoResult",
+    "bulk_analyze_video",
     "summarize_video",
     "transcribe_and_describe_video",
     "video_qa",
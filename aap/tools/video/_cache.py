@@ -0,0 +1,65 @@
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Buffer
+from urllib.parse import urlparse
+
+from .views import VideoResult
+
+
+def is_video_url(video_path: str) -> bool:
+    """
+    Whether ``video_path`` is an http(s) URL rather than a local path.
+    """
+    return urlparse(video_path).scheme in {"http", "https"}
+
+
+def video_key(video_path: str, video_data: Buffer | None = None) -> str:
+    """
+    Identifies a video by its URL, or by a BLAKE2b digest of a local file's
+    content so that renamed copies share entries and edited files do not.
+
+    :param video_path: YouTube URL or local file path.
+    :param video_data: Already loaded or mapped file content, hashed in place
+        instead of reading the file again.
+    """
+    if is_video_url(video_path):
+        return video_path
+    if video_data is not None:
+        return hashlib.blake2b(video_data).hexdigest()
+    with open(file=video_path, mode="rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
+
+
+class ResponseCache:
+    """
+    Process-local LRU cache of successful video tool results, keyed by
+    ``(video_key, prompt)``.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        :param capacity: Results kept before the least recently used is
+            evicted; 0 disables the cache.
+        """
+        self._capacity = capacity
+        self._entries: OrderedDict[tuple[str, str], VideoResult] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> VideoResult | None:
+        result = self._entries.get(key)
+        if result is None:
+            return None
+        self._entries.move_to_end(key)
+        return result.model_copy(deep=True)
+
+    def put(self, key: tuple[str, str], result: VideoResult) -> None:
+        if self._capacity <= 0:
+            return
+        self._entries[key] = result.model_copy(deep=True)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+
+# Answers are sampled, so the cache is off (0) unless a size is set.
+RESPONSE_CACHE = ResponseCache(int(os.getenv("AAP_VIDEO_RESPONSE_CACHE_SIZE", "0")))
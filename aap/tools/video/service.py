@@ -1,23 +1,337 @@
+import asyncio
+import atexit
+import functools
+import json
+import logging
+import mimetypes
+import mmap
 import os
-import traceback
-from typing import Literal
+import re
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Literal
 
-from dotenv import load_dotenv
+import httpx
 from fastmcp.server.server import FastMCP
-from google import genai
-from google.genai import types
-from google.genai.client import Client
-from google.genai.types import GenerateContentResponse, Part
 from pydantic import Field
+from pydantic.fields import FieldInfo
 
+from aap.tools._env import load_env
+from aap.tools._errors import exception_errors
+from aap.tools._loop import LoopLocal
+from aap.tools._ratelimit import MAX_RETRIES, backoff_delay, throttled
 from aap.tools.video.views import VideoResult
 
-from .views import VideoResult
+from ._cache import RESPONSE_CACHE, is_video_url, video_key
 
-load_dotenv(override=True)
+# google-genai is slow to import, so it is only loaded when a tool first
+# talks to Gemini rather than whenever the tool modules are imported.
+if TYPE_CHECKING:
+    from google.genai.client import Client
+    from google.genai.types import GenerateContentResponse, Part
+
+load_env()
 
 mcp = FastMCP("video")
 
+MODEL = "models/gemini-2.5-flash"
+# Gemini rejects inline video data above this size.
+MAX_INLINE_VIDEO_BYTES = 20 * 2**20
+# Kept identical across calls so that it, followed by the video, forms a
+# stable prompt prefix for Gemini's implicit caching; only the trailing text
+# part varies.
+SYSTEM_INSTRUCTION = (
+    "You analyze videos. Base every answer on what is shown and said in the "
+    "video, citing timestamps where they help."
+)
+# Explicit context caches let repeated prompts on one video skip re-encoding
+# it; entries are dropped locally a little before Gemini expires them.
+VIDEO_CACHE_TTL = int(os.getenv("AAP_VIDEO_CACHE_TTL", "600"))
+VIDEO_CACHE_MARGIN = 30
+_video_caches: dict[str, tuple[str | None, float]] = {}
+# Cache creations in flight, so concurrent first prompts on one video share a
+# single billed cache instead of each creating their own.
+_video_cache_creations: LoopLocal[dict[str, asyncio.Task[str | None]]] = LoopLocal(dict)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> "Client":
+    """
+    Shared Gemini client, built on first use so its HTTP connections stay
+    warm across tool calls. Call ``_get_client.cache_clear()`` after changing
+    ``GEMINI_API_KEY``.
+    """
+    from google import genai  # noqa: PLC0415
+
+    return genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+
+
+@throttled(
+    "gemini_flash",
+    max_concurrency=int(os.getenv("GEMINI_MAX_CONCURRENCY", "8")),
+    max_rpm=int(os.getenv("GEMINI_MAX_RPM", "60")),
+)
+async def _generate_with_video(
+    client: "Client", video_id: str, file_part: "Part", prompt: str
+) -> "GenerateContentResponse":
+    """
+    Ask Gemini ``prompt`` about a video, reusing an explicit context cache of
+    the video when one is live and creating one otherwise. Caches are keyed
+    by ``video_id``, the video's ``video_key``, so copies of one file share a
+    cache and an edited file gets a new one.
+
+    Falls back to sending the video inline when the cache cannot be created,
+    e.g. when the video is below the model's minimum cacheable size.
+    """
+    from google.genai import types  # noqa: PLC0415
+
+    cache_name: str | None = await _video_cache_name(client, video_id, file_part)
+    if cache_name is None:
+        contents: types.Content | str = types.Content(
+            role="user", parts=[file_part, types.Part(text=prompt)]
+        )
+        config = types.GenerateContentConfig(system_instruction=SYSTEM_INSTRUCTION)
+    else:
+        contents = prompt
+        config = types.GenerateContentConfig(cached_content=cache_name)
+
+    generate = functools.partial(
+        client.aio.models.generate_content,
+        model=MODEL,
+        contents=contents,
+        config=config,
+    )
+    for attempt in range(MAX_RETRIES):
+        try:
+            return await generate()
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+        await asyncio.sleep(backoff_delay(attempt))
+    return await generate()
+
+
+async def _video_cache_name(
+    client: "Client", video_id: str, file_part: "Part"
+) -> str | None:
+    """
+    Name of the live context cache of a video, creating it on first use; None
+    when the video cannot be cached.
+    """
+    now = time.monotonic()
+    for expired in [k for k, (_, expiry) in _video_caches.items() if expiry <= now]:
+        del _video_caches[expired]
+    if (cached := _video_caches.get(video_id)) is not None:
+        return cached[0]
+
+    creations = _video_cache_creations.current()
+    if (creation := creations.get(video_id)) is None:
+        creation = asyncio.create_task(_create_video_cache(client, video_id, file_part))
+        creations[video_id] = creation
+        creation.add_done_callback(lambda _: creations.pop(video_id, None))
+    # Shielded so that a cancelled caller does not cancel the creation other
+    # callers are waiting on.
+    return await asyncio.shield(creation)
+
+
+async def _create_video_cache(
+    client: "Client", video_id: str, file_part: "Part"
+) -> str | None:
+    """
+    Create a context cache of a video and record it in ``_video_caches``.
+    """
+    from google.genai import types  # noqa: PLC0415
+
+    started = time.monotonic()
+    try:
+        cache: types.CachedContent = await client.aio.caches.create(
+            model=MODEL,
+            config=types.CreateCachedContentConfig(
+                contents=[types.Content(role="user", parts=[file_part])],
+                system_instruction=SYSTEM_INSTRUCTION,
+                ttl=f"{VIDEO_CACHE_TTL}s",
+            ),
+        )
+        cache_name: str | None = cache.name
+    except Exception:
+        # Remembered as uncacheable for one TTL, so the failing create call is
+        # not repeated on every prompt.
+        cache_name = None
+    _video_caches[video_id] = (
+        cache_name,
+        started + VIDEO_CACHE_TTL - VIDEO_CACHE_MARGIN,
+    )
+    return cache_name
+
+
+@atexit.register
+def _delete_video_caches() -> None:
+    """
+    Delete the live context caches on exit rather than leaving them billed
+    until their TTL runs out.
+    """
+    now = time.monotonic()
+    names = [name for name, expiry in _video_caches.values() if name and expiry > now]
+    _video_caches.clear()
+    if not names:
+        return
+    client: Client = _get_client()
+    for name in names:
+        try:
+            client.caches.delete(name=name)
+        except Exception as e:
+            logging.warning(f"Failed to delete video cache {name}: {e}")
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Whether a failed Gemini call is worth retrying: rate limits, server
+    errors and timeouts, but not invalid requests.
+    """
+    from google.genai.errors import ClientError, ServerError  # noqa: PLC0415
+
+    if isinstance(error, ServerError | httpx.TimeoutException):
+        return True
+    return isinstance(error, ClientError) and error.code == HTTPStatus.TOO_MANY_REQUESTS
+
+
+def _map_video(video_path: str) -> mmap.mmap:
+    """
+    Map a local video read-only, so hashing it reads straight from the page
+    cache and the only copy made is the one handed to the SDK.
+    """
+    with open(file=video_path, mode="rb") as f:
+        size: int = os.fstat(f.fileno()).st_size
+        if size > MAX_INLINE_VIDEO_BYTES:
+            raise ValueError(
+                f"Video file is {size / 2**20:.1f} MiB; local videos must be "
+                f"under {MAX_INLINE_VIDEO_BYTES // 2**20} MiB."
+            )
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# Leading-byte signatures of the video containers Gemini accepts, checked in
+# order: every (offset, magic) pair must match for the MIME type to apply.
+_VIDEO_SIGNATURES: tuple[tuple[tuple[tuple[int, bytes], ...], str], ...] = (
+    (((4, b"ftyp"), (8, b"qt  ")), "video/quicktime"),
+    (((4, b"ftyp"), (8, b"3g")), "video/3gpp"),
+    (((4, b"ftyp"),), "video/mp4"),
+    (((0, b"\x1aE\xdf\xa3"),), "video/webm"),
+    (((0, b"RIFF"), (8, b"AVI ")), "video/avi"),
+    (((0, b"FLV"),), "video/x-flv"),
+    (((0, b"\x00\x00\x01\xba"),), "video/mpeg"),
+    (((0, b"\x00\x00\x01\xb3"),), "video/mpeg"),
+    (((0, b"\x30\x26\xb2\x75"),), "video/wmv"),
+)
+
+
+def _sniff_video_mime(video_path: str, head: bytes) -> str:
+    """
+    MIME type of a local video from its leading bytes, falling back to the
+    file extension and then to ``video/mp4``.
+    """
+    for checks, mime_type in _VIDEO_SIGNATURES:
+        if all(head.startswith(magic, offset) for offset, magic in checks):
+            return mime_type
+    return mimetypes.guess_type(video_path)[0] or "video/mp4"
+
+
+async def _build_video_part(video_path: str, video_map: mmap.mmap | None) -> "Part":
+    """
+    Build the Gemini part for a video: a file reference for YouTube URLs,
+    inline bytes for local files (must be <20MB).
+    """
+    from google.genai import types  # noqa: PLC0415
+
+    if video_map is None:
+        return types.Part(
+            file_data=types.FileData(file_uri=video_path),
+            video_metadata=types.VideoMetadata(fps=2),
+        )
+    video_bytes: bytes = await asyncio.to_thread(bytes, video_map)
+    return types.Part(
+        inline_data=types.Blob(
+            data=video_bytes,
+            mime_type=_sniff_video_mime(video_path, video_map[:12]),
+        ),
+        video_metadata=types.VideoMetadata(fps=2),
+    )
+
+
+SUMMARY_PROMPT = "Summarize this video."
+QUIZ_PROMPT = (
+    SUMMARY_PROMPT + " Then create a quiz with an answer key "
+    "based on the information in this video."
+)
+TRANSCRIBE_PROMPT = (
+    "Transcribe the audio from this video, "
+    "giving timestamps for salient events in the video. "
+    "Also provide visual descriptions."
+)
+_TASK_PROMPTS: dict[str, str] = {
+    "summary": SUMMARY_PROMPT,
+    "quiz": QUIZ_PROMPT,
+    "transcribe": TRANSCRIBE_PROMPT,
+}
+# Markdown code fence Gemini may wrap a JSON reply in
+_JSON_FENCE: re.Pattern[str] = re.compile(r"^```(?:json)?|```$", re.MULTILINE)
+
+
+def _qa_prompt(question: str, timestamp: str | None) -> str:
+    return f"At {timestamp}, {question}" if timestamp else question
+
+
+def _parse_answers(answer: str | None) -> dict[str, Any]:
+    """
+    Per-task answers of a bulk analysis, which Gemini may wrap in a code fence.
+    """
+    try:
+        return json.loads(_JSON_FENCE.sub("", answer or "").strip())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Could not parse the answers as JSON: {e}") from e
+
+
+async def _run_video_prompt(
+    video_path: str, prompt: str, parse_answers: bool = False
+) -> VideoResult:
+    """
+    Answer ``prompt`` about a video, serving repeats from the response cache.
+
+    With ``parse_answers``, the answer must be a JSON object of per-task
+    answers, stored in ``metadata["answers"]``; a reply that does not parse
+    fails the call and is not cached.
+    """
+    result: VideoResult = VideoResult(prompt=prompt, video_path=video_path)
+    video_map: mmap.mmap | None = None
+    try:
+        if not is_video_url(video_path):
+            video_map = await asyncio.to_thread(_map_video, video_path)
+        video_id: str = await asyncio.to_thread(video_key, video_path, video_map)
+        cache_key: tuple[str, str] = (video_id, prompt)
+        if (cached := RESPONSE_CACHE.get(cache_key)) is not None:
+            # Entries are keyed by content, so a hit may come from a copy of
+            # the video at another path.
+            cached.video_path = video_path
+            cached.prompt = prompt
+            return cached
+        client: Client = _get_client()
+        file_part: Part = await _build_video_part(video_path, video_map)
+        response: GenerateContentResponse = await _generate_with_video(
+            client, video_id, file_part, prompt
+        )
+        result.answer = response.text
+        if parse_answers:
+            result.metadata["answers"] = _parse_answers(result.answer)
+        result.execution_successful = True
+        RESPONSE_CACHE.put(cache_key, result)
+    except Exception as e:
+        result.errors = exception_errors(e)
+        result.execution_successful = False
+    finally:
+        if video_map is not None:
+            video_map.close()
+    return result
+
 
 @mcp.tool(
     description=(
@@ -43,42 +357,8 @@ async def summarize_video(
     Supports local files (<20MB) or YouTube URLs.
     Returns summary and optionally a quiz with answer key.
     """
-    prompt = "Summarize this video."
-    if summary_type == "quiz":
-        prompt += (
-            " Then create a quiz with an answer key "
-            "based on the information in this video."
-        )
-
-    result: VideoResult = VideoResult(prompt=prompt, video_path=video_path)
-    try:
-        client: Client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-
-        # Handle YouTube URL
-        if video_path.startswith("http"):
-            file_part: Part = types.Part(
-                file_data=types.FileData(file_uri=video_path),
-                video_metadata=types.VideoMetadata(fps=2),
-            )
-            contents: list[Part] = [file_part, types.Part(text=prompt)]
-        else:
-            # Local file (must be <20MB)
-            with open(file=video_path, mode="rb") as f:
-                video_bytes: bytes = f.read()
-            file_part: Part = types.Part(
-                inline_data=types.Blob(data=video_bytes, mime_type="video/mp4"),
-                video_metadata=types.VideoMetadata(fps=2),
-            )
-            contents: list[Part] = [file_part, types.Part(text=prompt)]
-        response: GenerateContentResponse = client.models.generate_content(
-            model="models/gemini-2.5-flash", contents=types.Content(parts=contents)
-        )
-        result.answer = response.text
-        result.execution_successful = True
-    except Exception as e:
-        result.errors = [traceback.format_exc(), str(e)]
-        result.execution_successful = False
-    return result
+    prompt = QUIZ_PROMPT if summary_type == "quiz" else SUMMARY_PROMPT
+    return await _run_video_prompt(video_path, prompt)
 
 
 @mcp.tool(
@@ -105,34 +385,7 @@ async def video_qa(
     """
     Ask a question about a specific timestamp or segment in a video using Gemini API.
     """
-    prompt: str = f"At {timestamp}, {question}" if timestamp else question
-    result: VideoResult = VideoResult(prompt=prompt, video_path=video_path)
-    try:
-        client: Client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-
-        if video_path.startswith("http"):
-            file_part: Part = types.Part(
-                file_data=types.FileData(file_uri=video_path),
-                video_metadata=types.VideoMetadata(fps=2),
-            )
-            contents: list[Part] = [file_part, types.Part(text=prompt)]
-        else:
-            with open(file=video_path, mode="rb") as f:
-                video_bytes: bytes = f.read()
-            file_part: Part = types.Part(
-                inline_data=types.Blob(data=video_bytes, mime_type="video/mp4"),
-                video_metadata=types.VideoMetadata(fps=2),
-            )
-            contents: list[Part] = [file_part, types.Part(text=prompt)]
-        response: GenerateContentResponse = client.models.generate_content(
-            model="models/gemini-2.5-flash", contents=types.Content(parts=contents)
-        )
-        result.answer = response.text
-        result.execution_successful = True
-    except Exception as e:
-        result.errors = [traceback.format_exc(), str(e)]
-        result.execution_successful = False
-    return result
+    return await _run_video_prompt(video_path, _qa_prompt(question, timestamp))
 
 
 @mcp.tool(
@@ -149,38 +402,66 @@ async def transcribe_and_describe_video(
     """
     Transcribe the audio from a video and provide visual descriptions using Gemini API.
     """
-    prompt = (
-        "Transcribe the audio from this video, "
-        "giving timestamps for salient events in the video. "
-        "Also provide visual descriptions."
+    return await _run_video_prompt(video_path, TRANSCRIBE_PROMPT)
+
+
+@mcp.tool(
+    description=(
+        "Run several video analyses (summary, quiz, question answering, "
+        "transcription) in one Gemini call so the video is processed once."
     )
-    result: VideoResult = VideoResult(prompt=prompt, video_path=video_path)
-    try:
-        client: Client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+)
+async def bulk_analyze_video(
+    video_path: str = Field(
+        ..., description="Path to local video file (<20MB) or YouTube URL"
+    ),
+    tasks: list[Literal["summary", "quiz", "qa", "transcribe"]] = Field(
+        ..., description="Analyses to run on the video"
+    ),
+    question: str = Field(
+        None, description="Question about the video, required for the 'qa' task"
+    ),
+    timestamp: str = Field(
+        None,
+        description=(
+            "Timestamp in MM:SS format for the 'qa' task, e.g., '01:15'. "
+            "If None, question is about the whole video."
+        ),
+    ),
+) -> VideoResult:
+    """
+    Run several analyses of one video in a single Gemini call.
 
-        if video_path.startswith("http"):
-            file_part: Part = types.Part(
-                file_data=types.FileData(file_uri=video_path),
-                video_metadata=types.VideoMetadata(fps=2),
-            )
-            contents: list[Part] = [file_part, types.Part(text=prompt)]
+    Returns the raw answer plus, in ``metadata["answers"]``, each task's answer
+    keyed by task name.
+    """
+    if isinstance(question, FieldInfo):
+        question: str | None = question.default
+    if isinstance(timestamp, FieldInfo):
+        timestamp: str | None = timestamp.default
+
+    task_prompts: dict[str, str] = {}
+    for task in dict.fromkeys(tasks):
+        if task == "qa":
+            if not question:
+                return VideoResult(
+                    prompt="",
+                    video_path=video_path,
+                    errors=["The 'qa' task requires a question."],
+                )
+            task_prompts[task] = _qa_prompt(question, timestamp)
         else:
-            with open(file=video_path, mode="rb") as f:
-                video_bytes: bytes = f.read()
-            file_part: Part = types.Part(
-                inline_data=types.Blob(data=video_bytes, mime_type="video/mp4"),
-                video_metadata=types.VideoMetadata(fps=2),
-            )
-            contents: list[Part] = [file_part, types.Part(text=prompt)]
-        response: GenerateContentResponse = client.models.generate_content(
-            model="models/gemini-2.5-flash", contents=types.Content(parts=contents)
+            task_prompts[task] = _TASK_PROMPTS[task]
+
+    prompt = (
+        "Complete each task below about this video. Reply with only a JSON "
+        f"object whose keys are exactly {', '.join(task_prompts)} and whose "
+        "values are each task's answer as a string.\n\n"
+        + "\n".join(
+            f"{task}: {task_prompt}" for task, task_prompt in task_prompts.items()
         )
-        result.answer = response.text
-        result.execution_successful = True
-    except Exception as e:
-        result.errors = [traceback.format_exc(), str(e)]
-        result.execution_successful = False
-    return result
+    )
+    return await _run_video_prompt(video_path, prompt, parse_answers=True)
 
 
 if __name__ == "__main__":
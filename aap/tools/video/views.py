@@ -1,15 +1,17 @@
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VideoResult(BaseModel):
     """Structured output for video processing tasks"""
 
+    model_config = ConfigDict(extra="forbid")
+
     prompt: str
     video_path: str
     answer: str | None = None
-    processed_videos: list[str] = []
+    processed_videos: list[str] = Field(default_factory=list)
     errors: list[str] | None = None
     execution_successful: bool = False
-    metadata: dict[str, Any] = {}
+    metadata: dict[str, Any] = Field(default_factory=dict)
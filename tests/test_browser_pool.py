@@ -0,0 +1,88 @@
+import asyncio
+import uuid
+
+import pytest
+
+pytest.importorskip("browser_use")
+
+from browser_use.browser.profile import BrowserProfile
+
+from aap.tools.browser.pool import BrowserPool
+
+
+class _FakeSession:
+    """Stands in for a BrowserSession so the pool can be driven offline."""
+
+    def __init__(self) -> None:
+        self.id = str(uuid.uuid4())
+        self.starts = 0
+        self.killed = False
+        self.connected = True
+
+    async def start(self) -> None:
+        self.starts += 1
+
+    async def kill(self) -> None:
+        self.killed = True
+
+    async def is_connected(self, restart: bool = True) -> bool:
+        return self.connected
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> BrowserPool:
+    def new_session(self: BrowserPool, slot: int) -> _FakeSession:
+        session = _FakeSession()
+        self._uses[session.id] = 0
+        return session
+
+    monkeypatch.setattr(BrowserPool, "_new_session", new_session)
+    return BrowserPool(BrowserProfile(), size=1, max_uses=2)
+
+
+async def _lease(pool: BrowserPool) -> _FakeSession:
+    async with pool.acquire() as session:
+        return session
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_until_max_uses(pool: BrowserPool) -> None:
+    first = await _lease(pool)
+    assert await _lease(pool) is first
+    assert first.killed
+
+    replacement = await _lease(pool)
+    assert replacement is not first
+    assert not replacement.killed
+
+
+@pytest.mark.asyncio
+async def test_disconnected_session_is_replaced(pool: BrowserPool) -> None:
+    async with pool.acquire() as session:
+        session.connected = False
+
+    assert session.killed
+    assert await _lease(pool) is not session
+
+
+@pytest.mark.asyncio
+async def test_sessions_wait_for_a_free_slot(pool: BrowserPool) -> None:
+    async with pool.acquire():
+        waiting = asyncio.create_task(_lease(pool))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+    await waiting
+
+
+@pytest.mark.asyncio
+async def test_close_kills_idle_sessions(pool: BrowserPool) -> None:
+    session = await _lease(pool)
+    await pool.close()
+    assert session.killed
+
+
+def test_pool_starts_over_under_a_new_event_loop(pool: BrowserPool) -> None:
+    first = asyncio.run(_lease(pool))
+    second = asyncio.run(_lease(pool))
+    assert second is not first
+    assert second.starts == 1
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import pytest
+from aworld.models.model_response import ModelResponse
+
+from aap.teams.llm_cache import LLMCache, llm_cache
+from aap.teams.llm_http import SharedHTTPOpenAIProvider
+
+
+@pytest.fixture
+def cache_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    llm_cache.cache_clear()
+    yield
+    llm_cache.cache_clear()
+
+
+def _response(content: str) -> ModelResponse:
+    return ModelResponse(id=content, model="model", content=content)
+
+
+def test_key_is_stable_across_dict_order() -> None:
+    params = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+    reordered = {"messages": [{"content": "hi", "role": "user"}], "model": "m"}
+    assert LLMCache.key("http://a", params) == LLMCache.key("http://a", reordered)
+
+
+def test_key_includes_endpoint() -> None:
+    params = {"model": "m", "messages": []}
+    assert LLMCache.key("http://a", params) != LLMCache.key("http://b", params)
+
+
+def test_key_includes_request() -> None:
+    assert LLMCache.key("http://a", {"temperature": 0}) != LLMCache.key(
+        "http://a", {"temperature": 0.5}
+    )
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    cache = LLMCache(str(tmp_path))
+    cache.set("k", _response("hello"))
+
+    cached = cache.get("k")
+    assert cached.content == "hello"
+    assert cached.model == "model"
+    assert cache.get("missing") is None
+
+
+def test_oldest_entries_are_evicted(tmp_path: Path) -> None:
+    cache = LLMCache(str(tmp_path), max_entries=2)
+    cache.set("a", _response("a"))
+    cache.set("b", _response("b"))
+    # Replacing an entry makes it the newest
+    cache.set("a", _response("a2"))
+    cache.set("c", _response("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a").content == "a2"
+    assert cache.get("c").content == "c"
+
+
+def test_entries_persist_across_instances(tmp_path: Path) -> None:
+    LLMCache(str(tmp_path)).set("k", _response("hello"))
+    assert LLMCache(str(tmp_path)).get("k").content == "hello"
+
+
+def test_cache_is_off_without_cache_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("LLM_CACHE_DIR", raising=False)
+    llm_cache.cache_clear()
+    try:
+        assert llm_cache() is None
+    finally:
+        llm_cache.cache_clear()
+
+
+@pytest.mark.usefixtures("cache_env")
+def test_only_greedy_completions_are_cached() -> None:
+    assert llm_cache() is not None
+    assert SharedHTTPOpenAIProvider._cache_for(0.0) is llm_cache()
+    assert SharedHTTPOpenAIProvider._cache_for(1.0) is None
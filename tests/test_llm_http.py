@@ -0,0 +1,39 @@
+import asyncio
+
+from openai import AsyncOpenAI
+
+from aap.teams.llm_http import SHARED_HTTP, SharedHTTPOpenAIProvider
+
+
+def _provider(**kwargs: object) -> SharedHTTPOpenAIProvider:
+    return SharedHTTPOpenAIProvider(
+        api_key="key", base_url="http://localhost:1/v1", model_name="m", **kwargs
+    )
+
+
+def test_async_client_is_shared_within_a_loop() -> None:
+    first, second = _provider(), _provider()
+
+    async def clients() -> tuple[AsyncOpenAI, AsyncOpenAI, AsyncOpenAI]:
+        return first.async_provider, first.async_provider, second.async_provider
+
+    a, b, other = asyncio.run(clients())
+    assert a is b
+    assert a._client is other._client
+
+
+def test_async_client_follows_the_running_loop() -> None:
+    provider = _provider()
+
+    async def client() -> AsyncOpenAI:
+        assert provider.async_provider._client is SHARED_HTTP.current()
+        return provider.async_provider
+
+    first = asyncio.run(client())
+    second = asyncio.run(client())
+    assert first is not second
+    assert first._client is not second._client
+
+
+def test_async_client_is_none_when_disabled() -> None:
+    assert _provider(async_enabled=False, sync_enabled=True).async_provider is None
@@ -0,0 +1,24 @@
+import asyncio
+
+from aap.tools._loop import LoopLocal
+
+
+def test_loop_local_is_shared_within_a_loop() -> None:
+    local: LoopLocal[object] = LoopLocal(object)
+
+    async def values() -> tuple[object, object]:
+        return local.current(), local.current()
+
+    first, second = asyncio.run(values())
+    assert first is second
+
+
+def test_loop_local_gives_each_loop_its_own_value() -> None:
+    local: LoopLocal[object] = LoopLocal(object)
+
+    async def value() -> object:
+        return local.current()
+
+    assert asyncio.run(value()) is not asyncio.run(value())
+    # The first loop's value is dropped once it is closed
+    assert len(local._values) == 1
@@ -6,6 +6,7 @@ Demonstrates the new Python 3.11+ features and Pydantic integration
 
 import asyncio
 import json
+from dataclasses import asdict
 from datetime import datetime
 from uuid import uuid4
 
@@ -22,6 +23,7 @@ from aap.teams.trading_multi_agent_pydantic import (
     OrderPlan,
     Alert,
     Task,
+    validate_allocation,
 )
 from aworld.config.conf import AgentConfig
 
@@ -37,7 +39,7 @@ async def test_pydantic_models():
         cash=0.1,
         rebalance_trigger=0.05
     )
-    print(f"Allocation model: {allocation.model_dump_json(indent=2)}")
+    print(f"Allocation model: {json.dumps(allocation, indent=2)}")
     
     # Test RiskMetrics model
     risk_metrics = RiskMetrics(
@@ -47,7 +49,7 @@ async def test_pydantic_models():
         beta=1.1,
         risk_limits={"max_position_size": 0.1, "max_sector_exposure": 0.25}
     )
-    print(f"RiskMetrics model: {risk_metrics.model_dump_json(indent=2)}")
+    print(f"RiskMetrics model: {json.dumps(risk_metrics, indent=2)}")
     
     # Test TradingSignal model
     signal = TradingSignal(
@@ -56,9 +58,10 @@ async def test_pydantic_models():
         entry_price=100.0,
         stop_loss=95.0,
         take_profit=110.0,
-        position_size=0.05
+        position_size=0.05,
+        reason=None,
     )
-    print(f"TradingSignal model: {signal.model_dump_json(indent=2)}")
+    print(f"TradingSignal model: {json.dumps(signal, indent=2)}")
     
     # Test BacktestStats model
     backtest = BacktestStats(
@@ -67,7 +70,7 @@ async def test_pydantic_models():
         win_rate=0.65,
         profit_factor=1.5
     )
-    print(f"BacktestStats model: {backtest.model_dump_json(indent=2)}")
+    print(f"BacktestStats model: {json.dumps(backtest, indent=2)}")
 
 
 async def test_message_system():
@@ -126,7 +129,7 @@ async def test_complete_workflow():
     result = await system.execute_trading_workflow(market_data)
     
     print("Workflow Result:")
-    print(json.dumps(result.model_dump(), indent=2, default=str))
+    print(json.dumps(asdict(result), indent=2, default=str))
     
     # Get system status
     status = system.get_system_status()
@@ -140,20 +143,13 @@ async def test_error_handling():
     
     try:
         # Test invalid allocation (should fail validation)
-        invalid_allocation = Allocation(
-            stocks=0.8,
-            bonds=0.3,  # This would make total > 1
-            cash=0.1,
-            rebalance_trigger=0.05
-        )
-    except ValueError as e:
-        print(f"Expected validation error: {e}")
-    
-    try:
-        # Test invalid trading signal
-        invalid_signal = TradingSignal(
-            signal="INVALID",  # Not in Literal["BUY", "SELL", "HOLD"]
-            confidence=0.75
+        invalid_allocation = validate_allocation(
+            Allocation(
+                stocks=0.8,
+                bonds=0.3,  # This would make total > 1
+                cash=0.1,
+                rebalance_trigger=0.05
+            )
         )
     except ValueError as e:
         print(f"Expected validation error: {e}")
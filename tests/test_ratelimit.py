@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from aap.tools import _ratelimit
+from aap.tools._ratelimit import BACKOFF_CAP, _Limiter, backoff_delay, throttled
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_refills_at_max_rpm(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = _Clock()
+    monkeypatch.setattr(_ratelimit.time, "monotonic", clock)
+    # Two tokens, refilled at one every 30 seconds
+    limiter = _Limiter(max_concurrency=1, max_rpm=2)
+
+    assert limiter._reserve() == 0
+    assert limiter._reserve() == 0
+    assert limiter._reserve() == pytest.approx(30)
+
+    clock.now += 15
+    assert limiter._reserve() == pytest.approx(15)
+
+    clock.now += 15
+    assert limiter._reserve() == 0
+    assert limiter._reserve() == pytest.approx(30)
+
+
+def test_token_bucket_does_not_exceed_capacity(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = _Clock()
+    monkeypatch.setattr(_ratelimit.time, "monotonic", clock)
+    limiter = _Limiter(max_concurrency=1, max_rpm=2)
+
+    clock.now += 3600
+    assert limiter._reserve() == 0
+    assert limiter._reserve() == 0
+    assert limiter._reserve() > 0
+
+
+@pytest.mark.asyncio
+async def test_throttled_caps_concurrency() -> None:
+    max_concurrency = 2
+    in_flight = peak = 0
+
+    @throttled(
+        "test_throttled_caps_concurrency", max_concurrency=max_concurrency, max_rpm=600
+    )
+    async def call() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == max_concurrency
+
+
+def test_throttled_runs_under_successive_event_loops() -> None:
+    @throttled("test_throttled_successive_loops", max_concurrency=1, max_rpm=600)
+    async def call() -> int:
+        await asyncio.sleep(0)
+        return 1
+
+    assert [asyncio.run(call()) for _ in range(3)] == [1, 1, 1]
+
+
+def test_backoff_delay_honors_retry_after() -> None:
+    assert backoff_delay(0, "2.5") == pytest.approx(2.5)
+    assert backoff_delay(0, "3600") == BACKOFF_CAP
+
+
+@pytest.mark.parametrize("attempt", [0, 3, 10])
+def test_backoff_delay_jitter_is_bounded(attempt: int) -> None:
+    for _ in range(100):
+        delay = backoff_delay(attempt, "not a number")
+        assert 0 <= delay <= min(BACKOFF_CAP, 2**attempt)
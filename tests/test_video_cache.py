@@ -0,0 +1,76 @@
+import hashlib
+from pathlib import Path
+
+from aap.tools.video._cache import ResponseCache, is_video_url, video_key
+from aap.tools.video.views import VideoResult
+
+
+def _result(answer: str) -> VideoResult:
+    return VideoResult(
+        prompt="p", video_path="v.mp4", answer=answer, execution_successful=True
+    )
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(capacity=2)
+    cache.put(("a", "p"), _result("a"))
+    cache.put(("b", "p"), _result("b"))
+    # Reading "a" makes "b" the least recently used
+    assert cache.get(("a", "p")).answer == "a"
+    cache.put(("c", "p"), _result("c"))
+
+    assert cache.get(("b", "p")) is None
+    assert cache.get(("a", "p")).answer == "a"
+    assert cache.get(("c", "p")).answer == "c"
+
+
+def test_response_cache_isolates_stored_results() -> None:
+    cache = ResponseCache(capacity=1)
+    result = _result("original")
+    cache.put(("a", "p"), result)
+    result.answer = "changed after put"
+
+    hit = cache.get(("a", "p"))
+    hit.answer = "changed after get"
+    hit.metadata["key"] = "value"
+
+    again = cache.get(("a", "p"))
+    assert again.answer == "original"
+    assert again.metadata == {}
+
+
+def test_response_cache_with_zero_capacity_stores_nothing() -> None:
+    cache = ResponseCache(capacity=0)
+    cache.put(("a", "p"), _result("a"))
+    assert cache.get(("a", "p")) is None
+
+
+def test_is_video_url() -> None:
+    assert is_video_url("https://www.youtube.com/watch?v=tm09cMTBTSU")
+    assert is_video_url("http://example.com/video.mp4")
+    assert not is_video_url("/tmp/video.mp4")
+    assert not is_video_url("video.mp4")
+
+
+def test_video_key_uses_url_as_is() -> None:
+    url = "https://www.youtube.com/watch?v=tm09cMTBTSU"
+    assert video_key(url) == url
+
+
+def test_video_key_depends_on_content_not_path(tmp_path: Path) -> None:
+    first = tmp_path / "first.mp4"
+    copy = tmp_path / "copy.mp4"
+    other = tmp_path / "other.mp4"
+    first.write_bytes(b"video bytes")
+    copy.write_bytes(b"video bytes")
+    other.write_bytes(b"other bytes")
+
+    assert video_key(str(first)) == video_key(str(copy))
+    assert video_key(str(first)) != video_key(str(other))
+    assert video_key(str(first)) == hashlib.blake2b(b"video bytes").hexdigest()
+
+
+def test_video_key_of_loaded_data_matches_file(tmp_path: Path) -> None:
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"video bytes")
+    assert video_key(str(path), memoryview(b"video bytes")) == video_key(str(path))
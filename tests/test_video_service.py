@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from aap.tools.video import service
+from aap.tools.video._cache import ResponseCache
+
+VIDEO_URL = "https://www.youtube.com/watch?v=tm09cMTBTSU"
+
+
+@pytest.fixture
+def gemini_reply(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Stubs the Gemini round-trip; tests set the reply text and count calls.
+    """
+    replies: list[str] = []
+
+    async def build_video_part(video_path: str, video_map: object) -> None:
+        return None
+
+    async def generate(client: object, video_id: str, part: object, prompt: str):
+        return SimpleNamespace(text=replies.pop(0))
+
+    monkeypatch.setattr(service, "_get_client", lambda: None)
+    monkeypatch.setattr(service, "_build_video_part", build_video_part)
+    monkeypatch.setattr(service, "_generate_with_video", generate)
+    monkeypatch.setattr(service, "RESPONSE_CACHE", ResponseCache(capacity=8))
+    return replies
+
+
+@pytest.mark.asyncio
+async def test_bulk_analysis_parses_fenced_answers(gemini_reply: list[str]) -> None:
+    gemini_reply.append('```json\n{"summary": "A talk."}\n```')
+
+    result = await service.bulk_analyze_video.fn(VIDEO_URL, ["summary"])
+
+    assert result.execution_successful
+    assert result.metadata["answers"] == {"summary": "A talk."}
+
+
+@pytest.mark.asyncio
+async def test_unparseable_bulk_analysis_fails_and_is_not_cached(
+    gemini_reply: list[str],
+) -> None:
+    gemini_reply.extend(["not json", '{"summary": "A talk."}'])
+
+    failed = await service.bulk_analyze_video.fn(VIDEO_URL, ["summary"])
+    assert not failed.execution_successful
+    assert failed.answer == "not json"
+    assert "answers" not in failed.metadata
+
+    retried = await service.bulk_analyze_video.fn(VIDEO_URL, ["summary"])
+    assert retried.execution_successful
+    assert retried.metadata["answers"] == {"summary": "A talk."}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_prompts_create_one_video_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: list[str] = []
+
+    async def create_video_cache(client: object, video_id: str, part: object) -> str:
+        created.append(video_id)
+        await asyncio.sleep(0.01)
+        service._video_caches[video_id] = ("cachedContents/1", float("inf"))
+        return "cachedContents/1"
+
+    monkeypatch.setattr(service, "_create_video_cache", create_video_cache)
+    monkeypatch.setattr(service, "_video_caches", {})
+
+    names = await asyncio.gather(
+        *(service._video_cache_name(None, "video", None) for _ in range(3))
+    )
+
+    assert names == ["cachedContents/1"] * 3
+    assert created == ["video"]
+    assert await service._video_cache_name(None, "video", None) == "cachedContents/1"
+    assert created == ["video"]